@@ -0,0 +1,4 @@
+"""
+Shared helpers used across the triage modules (classification, extraction,
+deduplication). Plain functions and small value types only; no models.
+"""
@@ -0,0 +1,38 @@
+"""Text helpers shared by the classifiers and the field extractor."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TicketView:
+    """Ticket text prepared once (stripped + lowercased) and shared by the classifiers."""
+
+    text: str
+    lower: str
+
+    @classmethod
+    def of(cls, ticket_text: str | None) -> "TicketView":
+        text = (ticket_text or "").strip()
+        return cls(text, text.lower())
+
+
+def is_word_char(ch: str) -> bool:
+    """Same class as \\w for str patterns; used to check \\b at keyword hits."""
+    return ch.isalnum() or ch == "_"
+
+
+def strip_fence(raw: str) -> str:
+    """Drop a ```lang ... ``` markdown fence around an already-stripped LLM response."""
+    if not raw.startswith("```"):
+        return raw
+    i = 3
+    while i < len(raw) and is_word_char(raw[i]):
+        i += 1
+    if raw.startswith("\n", i):
+        i += 1
+    raw = raw[i:]
+    body = raw.rstrip()
+    if not body.endswith("```"):
+        return raw
+    body = body[:-3]
+    return body[:-1] if body.endswith("\n") else body
@@ -0,0 +1,14 @@
+"""Vector helpers shared by deduplication and the classification result cache."""
+
+import numpy as np
+
+
+def l2_normalize(v: list[float] | np.ndarray | None) -> np.ndarray | None:
+    """Scale v to unit L2 norm as a float32 array; None for empty or zero vectors."""
+    if v is None or len(v) == 0:
+        return None
+    arr = np.asarray(v, dtype=np.float32)
+    norm = np.linalg.norm(arr)
+    if norm == 0:
+        return None
+    return arr / norm
@@ -16,6 +16,7 @@ from deduplication.schema import (
     DeduplicationResult,
     ProcessedTicketView,
 )
+from deduplication.matchers import build_metadata_index, quantize_embedding
 from deduplication.service import DeduplicationService
 
 __all__ = [
@@ -25,4 +26,6 @@ __all__ = [
     "DeduplicationResult",
     "ProcessedTicketView",
     "DeduplicationService",
+    "build_metadata_index",
+    "quantize_embedding",
 ]
@@ -7,34 +7,179 @@ Deduplication methods from README §3.
 """
 
 import math
-import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Callable
 
+import numpy as np
+
+try:
+    import simsimd as _simsimd
+except ImportError:  # optional SIMD kernels; pure Python / NumPy fallback below
+    _simsimd = None
+
+try:
+    from numba import njit as _njit
+except ImportError:  # optional JIT for cosine_similarity on ndarrays
+    _njit = None
+
+from common.vectors import l2_normalize
 from deduplication.schema import (
     DuplicateMatch,
     DuplicateMatchType,
     ProcessedTicketView,
+    _normalize_error_message,
+    _utc_timestamp,
 )
 
 
-def _normalize_error_message(msg: str | None) -> str:
-    """Normalize error string for comparison (strip, lower, collapse whitespace)."""
-    if not msg:
-        return ""
-    return " ".join(re.split(r"\s+", msg.strip().lower()))
-
-
 def _same_timeframe(
-    received_at: datetime | None,
-    candidate_at: datetime | None,
+    received_ts: float | None,
+    candidate_ts: float | None,
     window_hours: float = 1.0,
 ) -> bool:
-    """True if both timestamps are within window_hours (or same day if window large)."""
-    if received_at is None or candidate_at is None:
+    """True if both POSIX timestamps are within window_hours of each other."""
+    if received_ts is None or candidate_ts is None:
         return False
-    delta = abs((received_at - candidate_at).total_seconds())
-    return delta <= window_hours * 3600
+    return abs(received_ts - candidate_ts) <= window_hours * 3600
+
+
+def candidates_in_timeframe(
+    received_at: datetime | None,
+    candidates: list[ProcessedTicketView],
+    window_hours: float = 1.0,
+) -> list[ProcessedTicketView]:
+    """Candidates received within window_hours of received_at (cached timestamps, no datetime math)."""
+    if received_at is None:
+        return []
+    ts = _utc_timestamp(received_at)
+    return [
+        c for c in candidates if _same_timeframe(ts, c.received_at_ts, window_hours)
+    ]
+
+
+def metadata_key(
+    account_id: str | None,
+    error_message: str | None,
+    *,
+    normalized_error: str | None = None,
+) -> tuple[str, str] | None:
+    """
+    Exact-match key for metadata matching: (stripped account_id, normalized error).
+
+    None when either part is missing (such tickets never metadata-match).
+    normalized_error: error_message already normalized (e.g. a view's cached value).
+    """
+    if not account_id:
+        return None
+    error = (
+        normalized_error
+        if normalized_error is not None
+        else _normalize_error_message(error_message)
+    )
+    if not error:
+        return None
+    return account_id.strip(), error
+
+
+def build_metadata_index(
+    candidates: list[ProcessedTicketView],
+) -> dict[tuple[str, str], list[ProcessedTicketView]]:
+    """Bucket candidates by metadata_key so a lookup replaces a full scan."""
+    index: dict[tuple[str, str], list[ProcessedTicketView]] = {}
+    for cand in candidates:
+        key = metadata_key(
+            cand.account_id, None, normalized_error=cand.normalized_error
+        )
+        if key is not None:
+            index.setdefault(key, []).append(cand)
+    return index
+
+
+MetadataMatcher = Callable[
+    [str | None, str, float | None, ProcessedTicketView], DuplicateMatch | None
+]
+
+
+@lru_cache(maxsize=None)
+def make_metadata_matcher(
+    same_account_required: bool = True,
+    same_error_required: bool = True,
+    time_window_hours: float = 1.0,
+) -> MetadataMatcher:
+    """
+    Build a metadata matcher specialized for fixed settings (no per-candidate branching on them).
+
+    The returned function takes (current_account_id, current_error_normalized,
+    current_received_at_ts, candidate) and returns a DuplicateMatch (EXACT) or
+    None. Checks run cheapest first: timeframe, account, then error string.
+    """
+    window_seconds = time_window_hours * 3600
+    reason = "Same account, same error string, same timeframe"
+    if not same_error_required:
+        reason = "Same account, same timeframe"
+
+    def exact(candidate: ProcessedTicketView) -> DuplicateMatch:
+        return DuplicateMatch.model_construct(
+            candidate_ticket_id=candidate.ticket_id,
+            match_type=DuplicateMatchType.EXACT,
+            similarity_score=1.0,
+            reason=reason,
+        )
+
+    if same_account_required and same_error_required:
+
+        def match(account_id, error_normalized, received_ts, candidate):
+            cand_ts = candidate.received_at_ts
+            if received_ts is None or cand_ts is None:
+                return None
+            if abs(received_ts - cand_ts) > window_seconds:
+                return None
+            if not account_id or not candidate.account_id:
+                return None
+            if account_id.strip() != candidate.account_id.strip():
+                return None
+            if not error_normalized or error_normalized != candidate.normalized_error:
+                return None
+            return exact(candidate)
+
+    elif same_account_required:
+
+        def match(account_id, error_normalized, received_ts, candidate):
+            cand_ts = candidate.received_at_ts
+            if received_ts is None or cand_ts is None:
+                return None
+            if abs(received_ts - cand_ts) > window_seconds:
+                return None
+            if not account_id or not candidate.account_id:
+                return None
+            if account_id.strip() != candidate.account_id.strip():
+                return None
+            return exact(candidate)
+
+    elif same_error_required:
+
+        def match(account_id, error_normalized, received_ts, candidate):
+            cand_ts = candidate.received_at_ts
+            if received_ts is None or cand_ts is None:
+                return None
+            if abs(received_ts - cand_ts) > window_seconds:
+                return None
+            if not error_normalized or error_normalized != candidate.normalized_error:
+                return None
+            return exact(candidate)
+
+    else:
+
+        def match(account_id, error_normalized, received_ts, candidate):
+            cand_ts = candidate.received_at_ts
+            if received_ts is None or cand_ts is None:
+                return None
+            if abs(received_ts - cand_ts) > window_seconds:
+                return None
+            return exact(candidate)
+
+    return match
 
 
 def metadata_match(
@@ -46,50 +191,174 @@ def metadata_match(
     same_account_required: bool = True,
     same_error_required: bool = True,
     time_window_hours: float = 1.0,
+    current_error_normalized: str | None = None,
+    current_received_at_ts: float | None = None,
 ) -> DuplicateMatch | None:
     """
     README: Metadata matching — same account, same error string, same timeframe.
 
     Returns a DuplicateMatch (EXACT) if all required criteria match; else None.
+    Checks run cheapest first (timeframe, account, then error normalization).
+    current_error_normalized: current_error already passed through
+    _normalize_error_message (lets callers normalize once for many candidates).
+    current_received_at_ts: _utc_timestamp(current_received_at), likewise precomputed.
+    For many candidates, use make_metadata_matcher() once instead.
     """
-    if same_account_required:
-        if not current_account_id or not candidate.account_id:
-            return None
-        if current_account_id.strip() != candidate.account_id.strip():
-            return None
-    if same_error_required:
-        n1 = _normalize_error_message(current_error)
-        n2 = _normalize_error_message(candidate.error_message)
-        if not n1 or not n2:
-            return None
-        if n1 != n2:
-            return None
-    if not _same_timeframe(
-        current_received_at, candidate.received_at, time_window_hours
-    ):
-        return None
-
-    reason = "Same account, same error string, same timeframe"
-    if not same_error_required:
-        reason = "Same account, same timeframe"
-    return DuplicateMatch(
-        candidate_ticket_id=candidate.ticket_id,
-        match_type=DuplicateMatchType.EXACT,
-        similarity_score=1.0,
-        reason=reason,
+    if current_received_at_ts is None and current_received_at is not None:
+        current_received_at_ts = _utc_timestamp(current_received_at)
+    if current_error_normalized is None:
+        current_error_normalized = _normalize_error_message(current_error)
+    matcher = make_metadata_matcher(
+        same_account_required, same_error_required, time_window_hours
     )
+    return matcher(
+        current_account_id, current_error_normalized, current_received_at_ts, candidate
+    )
+
+
+if _njit is not None:
+
+    @_njit(cache=True, fastmath=True)
+    def _cos_numba(a, b):
+        dot = 0.0
+        na = 0.0
+        nb = 0.0
+        for i in range(a.shape[0]):
+            dot += a[i] * b[i]
+            na += a[i] * a[i]
+            nb += b[i] * b[i]
+        if na == 0.0 or nb == 0.0:
+            return 0.0
+        return dot / np.sqrt(na * nb)
 
+else:
+    _cos_numba = None
+
+
+def cosine_similarity(
+    a: list[float] | np.ndarray,
+    b: list[float] | np.ndarray,
+    *,
+    normalized: bool = False,
+) -> float:
+    """
+    Cosine similarity between two vectors. Returns value in [-1, 1].
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Cosine similarity between two vectors. Returns value in [-1, 1]."""
-    if not a or not b or len(a) != len(b):
+    normalized: both inputs are already unit length; skip the norms and return the dot product.
+    """
+    if a is None or b is None or len(a) == 0 or len(a) != len(b):
         return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(x * x for x in b))
+    both_arrays = isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    if _simsimd is not None:
+        # simsimd returns cosine distance, and 0.0 for two zero vectors
+        if not a.any() or not b.any():
+            return 0.0
+        return 1.0 - float(_simsimd.cosine(a, b))
+    if _cos_numba is not None and both_arrays:
+        return float(_cos_numba(a, b))
+    dot = float(a @ b)
+    if normalized:
+        return dot
+    na = float(a @ a)
+    nb = float(b @ b)
     if na == 0 or nb == 0:
         return 0.0
-    return dot / (na * nb)
+    return dot / math.sqrt(na * nb)
+
+
+def _mask_zero_vectors(scores: np.ndarray, q: np.ndarray, C: np.ndarray) -> np.ndarray:
+    # simsimd.cdist gives distance 0.0 (similarity 1.0) between two zero vectors
+    if not q.any():
+        return np.zeros(C.shape[0], dtype=np.float32)
+    scores[~C.any(axis=1)] = 0.0
+    return scores
+
+
+def _score_candidates_numpy(
+    q: np.ndarray, C: np.ndarray, *, normalized: bool = False
+) -> np.ndarray:
+    """
+    Cosine similarity of query q (D,) against every row of C (N, D) in one matmul.
+
+    Both sides are L2-normalized first (unless normalized=True) so cosine
+    reduces to scores = C @ q. Zero vectors score 0.0. Without normalized=True,
+    uses simsimd.cdist when installed, which loops over all candidates in C.
+    """
+    q = np.asarray(q, dtype=np.float32)
+    C = np.asarray(C, dtype=np.float32)
+    if normalized:
+        return C @ q
+    if _simsimd is not None:
+        dist = np.asarray(_simsimd.cdist(q[None, :], C, metric="cosine"))
+        return _mask_zero_vectors(1.0 - dist.reshape(-1), q, C)
+    qn = np.linalg.norm(q)
+    if qn == 0:
+        return np.zeros(C.shape[0], dtype=np.float32)
+    q = q / qn
+    norms = np.linalg.norm(C, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    C = C / norms
+    return C @ q
+
+
+def quantize_embedding(v: list[float]) -> tuple[bytes, float]:
+    """
+    Symmetric per-vector int8 quantization: returns (int8 bytes, scale).
+
+    v ≈ int8 values * scale. Store the result on ProcessedTicketView.embedding_i8 /
+    embedding_scale to scan candidates at 1 byte per dimension.
+    """
+    arr = np.asarray(v, dtype=np.float32)
+    peak = float(np.max(np.abs(arr))) if arr.size else 0.0
+    if peak == 0:
+        return np.zeros(arr.size, dtype=np.int8).tobytes(), 0.0
+    scale = peak / 127
+    return np.round(arr / scale).astype(np.int8).tobytes(), scale
+
+
+def _score_candidates_int8(q: np.ndarray, C: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of int8 query q (D,) against int8 rows of C (N, D).
+
+    Per-vector scales cancel out of cosine, so this is an int32 dot product
+    divided by the int8 norms. Zero vectors score 0.0.
+    """
+    if _simsimd is not None:
+        dist = np.asarray(_simsimd.cdist(q[None, :], C, metric="cosine"))
+        return _mask_zero_vectors(1.0 - dist.reshape(-1), q, C)
+    q32 = q.astype(np.int32)
+    C32 = C.astype(np.int32)
+    dots = (C32 @ q32).astype(np.float32)
+    norms = np.sqrt((C32 * C32).sum(axis=1) * int(q32 @ q32)).astype(np.float32)
+    scores = np.zeros(C.shape[0], dtype=np.float32)
+    np.divide(dots, norms, out=scores, where=norms > 0)
+    return scores
+
+
+def _semantic_match_from_score(
+    candidate_ticket_id: str,
+    score: float,
+    exact_threshold: float,
+    likely_threshold: float,
+) -> DuplicateMatch | None:
+    """Map a cosine score onto EXACT / LIKELY / no match."""
+    if score >= exact_threshold:
+        return DuplicateMatch.model_construct(
+            candidate_ticket_id=candidate_ticket_id,
+            match_type=DuplicateMatchType.EXACT,
+            similarity_score=round(score, 4),
+            reason=f"Semantic similarity {score:.2f} >= {exact_threshold}",
+        )
+    if score >= likely_threshold:
+        return DuplicateMatch.model_construct(
+            candidate_ticket_id=candidate_ticket_id,
+            match_type=DuplicateMatchType.LIKELY,
+            similarity_score=round(score, 4),
+            reason=f"Semantic similarity {score:.2f} in [{likely_threshold}, {exact_threshold})",
+        )
+    return None
 
 
 def semantic_match(
@@ -107,33 +376,114 @@ def semantic_match(
     exact_threshold: >= this → EXACT (auto-merge).
     likely_threshold: >= this and < exact_threshold → LIKELY (agent review).
     """
-    cand_emb = candidate.embedding
-    if cand_emb is None and embedding_fn and candidate.cleaned_text:
-        cand_emb = embedding_fn(candidate.cleaned_text)
+    cand_unit = candidate.embedding_unit
+    if candidate.embedding is None and embedding_fn and candidate.cleaned_text:
+        cand_unit = l2_normalize(embedding_fn(candidate.cleaned_text))
     if current_embedding is None and embedding_fn and current_text:
         current_embedding = embedding_fn(current_text)
+    current_unit = l2_normalize(current_embedding)
 
-    if not current_embedding or not cand_emb:
+    if current_unit is None or cand_unit is None:
         return None
-    if len(current_embedding) != len(cand_emb):
+    if len(current_unit) != len(cand_unit):
         return None
 
-    score = cosine_similarity(current_embedding, cand_emb)
-    if score >= exact_threshold:
-        return DuplicateMatch(
-            candidate_ticket_id=candidate.ticket_id,
-            match_type=DuplicateMatchType.EXACT,
-            similarity_score=round(score, 4),
-            reason=f"Semantic similarity {score:.2f} >= {exact_threshold}",
+    score = cosine_similarity(current_unit, cand_unit, normalized=True)
+    return _semantic_match_from_score(
+        candidate.ticket_id, score, exact_threshold, likely_threshold
+    )
+
+
+def semantic_matches(
+    current_embedding: list[float] | None,
+    current_text: str,
+    candidates: list[ProcessedTicketView],
+    embedding_fn: Callable[[str], list[float]] | None,
+    *,
+    exact_threshold: float = 0.92,
+    likely_threshold: float = 0.85,
+    embedding_batch_fn: Callable[[list[str]], list[list[float]]] | None = None,
+) -> list[DuplicateMatch]:
+    """
+    Batched semantic_match: score every candidate against the current ticket at once.
+
+    Candidate embeddings are stacked into an (N, D) matrix and scored with a
+    single matmul over unit vectors (candidate.embedding_unit is cached).
+    Candidates with embedding_i8 set are scored in a separate int8 matrix.
+    Candidates without an embedding (or of a different dimension) are skipped.
+    Returns matches in candidate order.
+
+    embedding_batch_fn: optional list[str] -> list[list[float]]; when given, the
+    current text and every candidate missing an embedding are embedded in one
+    call (preferred over embedding_fn).
+    """
+    pending = [
+        i
+        for i, cand in enumerate(candidates)
+        if cand.embedding is None and cand.embedding_i8 is None and cand.cleaned_text
+    ]
+    computed: dict[int, list[float]] = {}
+    if embedding_batch_fn is not None:
+        embed_current = current_embedding is None and bool(current_text)
+        texts = [candidates[i].cleaned_text for i in pending]
+        if embed_current:
+            texts.insert(0, current_text)
+        vectors = embedding_batch_fn(texts) if texts else []
+        if embed_current:
+            current_embedding, vectors = vectors[0], vectors[1:]
+        computed = dict(zip(pending, vectors))
+    elif embedding_fn is not None:
+        if current_embedding is None and current_text:
+            current_embedding = embedding_fn(current_text)
+        if current_embedding:
+            computed = {i: embedding_fn(candidates[i].cleaned_text) for i in pending}
+    current_unit = l2_normalize(current_embedding)
+    if current_unit is None:
+        return []
+
+    dim = len(current_unit)
+    float_idx: list[int] = []
+    float_rows: list[np.ndarray] = []
+    i8_idx: list[int] = []
+    i8_rows: list[bytes] = []
+    for i, cand in enumerate(candidates):
+        if cand.embedding_i8 is not None and len(cand.embedding_i8) == dim:
+            i8_idx.append(i)
+            i8_rows.append(cand.embedding_i8)
+            continue
+        unit = cand.embedding_unit if i not in computed else l2_normalize(computed[i])
+        if unit is None or len(unit) != dim:
+            continue
+        float_idx.append(i)
+        float_rows.append(unit)
+
+    scores: dict[int, float] = {}
+    if float_rows:
+        float_scores = _score_candidates_numpy(
+            current_unit,
+            np.stack(float_rows),
+            normalized=True,
         )
-    if score >= likely_threshold:
-        return DuplicateMatch(
-            candidate_ticket_id=candidate.ticket_id,
-            match_type=DuplicateMatchType.LIKELY,
-            similarity_score=round(score, 4),
-            reason=f"Semantic similarity {score:.2f} in [{likely_threshold}, {exact_threshold})",
+        scores.update(zip(float_idx, float_scores.tolist()))
+    if i8_rows:
+        q_i8, _ = quantize_embedding(current_unit)
+        i8_scores = _score_candidates_int8(
+            np.frombuffer(q_i8, dtype=np.int8),
+            np.frombuffer(b"".join(i8_rows), dtype=np.int8).reshape(-1, dim),
         )
-    return None
+        scores.update(zip(i8_idx, i8_scores.tolist()))
+
+    matches: list[DuplicateMatch] = []
+    for i in sorted(scores):
+        score = scores[i]
+        if score < likely_threshold:
+            continue
+        m = _semantic_match_from_score(
+            candidates[i].ticket_id, score, exact_threshold, likely_threshold
+        )
+        if m:
+            matches.append(m)
+    return matches
 
 
 def incident_match(
@@ -161,7 +511,7 @@ def incident_match(
         return None, None
 
     return (
-        DuplicateMatch(
+        DuplicateMatch.model_construct(
             candidate_ticket_id=incident_id,
             match_type=DuplicateMatchType.KNOWN_INCIDENT,
             reason="Linked to active incident",
@@ -5,10 +5,29 @@ Methods: Semantic similarity, Metadata matching, Incident correlation.
 Actions: Exact duplicate → Auto-merge, Likely duplicate → Agent review, Known incident → Link + notify.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
+
+from common.vectors import l2_normalize
+
+
+@lru_cache(maxsize=4096)
+def _normalize_error_message(msg: str | None) -> str:
+    """Normalize error string for comparison (strip, lower, collapse whitespace)."""
+    if not msg:
+        return ""
+    return " ".join(msg.lower().split())
+
+
+def _utc_timestamp(dt: datetime) -> float:
+    """POSIX seconds for dt; naive values are UTC (as stored before tz-aware received_at)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 class DuplicateMatchType(str, Enum):
@@ -36,6 +55,8 @@ class DuplicateMatch(BaseModel):
     similarity_score: float | None = None  # For semantic match (0–1)
     reason: str = ""  # e.g. "Same account, same error, same hour"
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
 
 class DeduplicationResult(BaseModel):
     """Result of deduplication check: action and any matches."""
@@ -50,12 +71,42 @@ class DeduplicationResult(BaseModel):
         return self.action != DeduplicationAction.NONE
 
 
+class _ViewDerived:
+    """
+    Values ProcessedTicketView computes from its fields (see model_post_init).
+
+    Always compares equal: the values follow from the fields, which pydantic
+    already compares, and an ndarray would make == raise.
+    """
+
+    __slots__ = ("embedding_unit", "received_at_ts", "normalized_error")
+
+    def __init__(
+        self,
+        embedding_unit: np.ndarray | None,
+        received_at_ts: float | None,
+        normalized_error: str,
+    ):
+        self.embedding_unit = embedding_unit
+        self.received_at_ts = received_at_ts
+        self.normalized_error = normalized_error
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ViewDerived)
+
+    __hash__ = None
+
+
 class ProcessedTicketView(BaseModel):
     """
     Minimal view of a previously processed ticket for comparison.
 
     Used as candidate for metadata/semantic matching. Optional embedding
     for semantic similarity (if absent, computed from cleaned_text when embedding_fn provided).
+    Read-only (frozen): embedding_unit, normalized_error and received_at_ts are
+    computed once per view, at construction or model_copy(update=...). Views
+    loaded from a trusted internal store can skip validation with
+    ProcessedTicketView.model_construct(...).
     """
 
     ticket_id: str
@@ -64,3 +115,38 @@ class ProcessedTicketView(BaseModel):
     received_at: datetime | None = None
     cleaned_text: str = ""
     embedding: list[float] | None = None  # Optional precomputed embedding
+    # Optional int8 copy of embedding (see matchers.quantize_embedding); preferred when set
+    embedding_i8: bytes | None = None
+    embedding_scale: float | None = None  # embedding ≈ int8 values * scale
+
+    model_config = {"frozen": True, "extra": "ignore"}
+
+    _derived: _ViewDerived = PrivateAttr()
+
+    def model_post_init(self, context: object) -> None:
+        self._derived = _ViewDerived(
+            l2_normalize(self.embedding),
+            _utc_timestamp(self.received_at) if self.received_at else None,
+            _normalize_error_message(self.error_message),
+        )
+
+    def model_copy(self, *, update: dict[str, object] | None = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
+    @property
+    def embedding_unit(self) -> np.ndarray | None:
+        """embedding as a unit-L2-norm float32 array, so cosine is a plain dot product."""
+        return self._derived.embedding_unit
+
+    @property
+    def received_at_ts(self) -> float | None:
+        """received_at as POSIX seconds, so timeframe checks are a float compare."""
+        return self._derived.received_at_ts
+
+    @property
+    def normalized_error(self) -> str:
+        """error_message normalized for metadata matching ("" if absent)."""
+        return self._derived.normalized_error
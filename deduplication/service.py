@@ -13,10 +13,14 @@ from deduplication.schema import (
     DuplicateMatch,
     DuplicateMatchType,
     ProcessedTicketView,
+    _normalize_error_message,
+    _utc_timestamp,
 )
 from deduplication.matchers import (
-    metadata_match,
-    semantic_match,
+    candidates_in_timeframe,
+    make_metadata_matcher,
+    metadata_key,
+    semantic_matches,
     incident_match,
 )
 
@@ -28,26 +32,50 @@ class DeduplicationService:
     - Metadata matching: same account, same error string, same timeframe
     - Semantic similarity: embeddings + cosine threshold (e.g. >0.92) → exact/likely
     - Incident correlation: link to active outage → link_notify
+
+    embedding_batch_fn: optional batch variant of embedding_fn (list[str] ->
+    list[list[float]]); missing embeddings for a check are computed in one call.
+    candidate_index: optional prebuilt build_metadata_index() over the candidate
+    store; when given, metadata matching looks up that index instead of the
+    candidates passed to check() (requires both metadata_same_* flags).
+    metadata_same_account_required / metadata_same_error_required: which metadata
+    criteria must match besides the timeframe; the matcher is specialized once here.
     """
 
     def __init__(
         self,
         *,
         embedding_fn: Callable[[str], list[float]] | None = None,
+        embedding_batch_fn: Callable[[list[str]], list[list[float]]] | None = None,
         semantic_exact_threshold: float = 0.92,
         semantic_likely_threshold: float = 0.85,
         metadata_time_window_hours: float = 1.0,
+        metadata_same_account_required: bool = True,
+        metadata_same_error_required: bool = True,
         get_active_incident_ids: Callable[[], list[str]] | None = None,
         link_to_incident: Callable[
             [str, str | None, str | None], str | None
         ] | None = None,
+        candidate_index: dict[
+            tuple[str, str], list[ProcessedTicketView]
+        ] | None = None,
     ):
         self._embedding_fn = embedding_fn
+        self._embedding_batch_fn = embedding_batch_fn
         self._semantic_exact = semantic_exact_threshold
         self._semantic_likely = semantic_likely_threshold
         self._metadata_window = metadata_time_window_hours
+        self._metadata_by_key = (
+            metadata_same_account_required and metadata_same_error_required
+        )
+        self._match_metadata = make_metadata_matcher(
+            metadata_same_account_required,
+            metadata_same_error_required,
+            metadata_time_window_hours,
+        )
         self._get_active_incidents = get_active_incident_ids
         self._link_to_incident = link_to_incident
+        self._candidate_index = candidate_index
 
     def check(
         self,
@@ -62,44 +90,59 @@ class DeduplicationService:
         product: str | None = None,
     ) -> DeduplicationResult:
         """
-        Run deduplication: metadata → semantic → incident. Return action and matches.
+        Run deduplication: metadata → incident → semantic. Return action and matches.
+
+        The semantic scan is skipped when the ticket links to an active incident
+        (LINK_NOTIFY outranks AUTO_MERGE/AGENT_REVIEW), so matches then holds only
+        metadata matches plus the incident. Candidates that already matched on
+        metadata are not re-scored semantically.
 
         candidates: Previously processed tickets to compare against (e.g. from same account or vector store).
         """
         matches: list[DuplicateMatch] = []
+        seen: set[str] = set()  # candidate_ticket_id of each entry in matches
         linked_incident_id: str | None = None
 
-        # 1. Metadata matching
-        for cand in candidates:
+        # 1. Metadata matching: when account and error are both required, only
+        # candidates sharing (account, error) can match, so look up that bucket
+        # and check the timeframe on the short list. Without a prebuilt index,
+        # filter by timeframe first (a float compare on cached timestamps), then
+        # keep the nearby candidates whose key matches; an index built per check
+        # would be used for this one lookup only.
+        received_ts = _utc_timestamp(received_at) if received_at else None
+        error_normalized = _normalize_error_message(error_message)
+        if received_at is None:
+            bucket = []
+        elif not self._metadata_by_key:
+            bucket = candidates_in_timeframe(
+                received_at, candidates, self._metadata_window
+            )
+        elif (key := metadata_key(account_id, error_message)) is None:
+            bucket = []
+        elif self._candidate_index is not None:
+            bucket = self._candidate_index.get(key, [])
+        else:
+            nearby = candidates_in_timeframe(
+                received_at, candidates, self._metadata_window
+            )
+            bucket = [
+                cand
+                for cand in nearby
+                if metadata_key(
+                    cand.account_id, None, normalized_error=cand.normalized_error
+                )
+                == key
+            ]
+        for cand in bucket:
             if cand.ticket_id == ticket_id:
                 continue
-            m = metadata_match(
-                account_id,
-                error_message,
-                received_at,
-                cand,
-                time_window_hours=self._metadata_window,
-            )
-            if m and not _already_matched(m.candidate_ticket_id, matches):
+            m = self._match_metadata(account_id, error_normalized, received_ts, cand)
+            if m and m.candidate_ticket_id not in seen:
                 matches.append(m)
+                seen.add(m.candidate_ticket_id)
 
-        # 2. Semantic similarity (if we have embedding or embedding_fn)
-        if candidates and (current_embedding or self._embedding_fn):
-            for cand in candidates:
-                if cand.ticket_id == ticket_id:
-                    continue
-                m = semantic_match(
-                    current_embedding,
-                    cleaned_text,
-                    cand,
-                    self._embedding_fn,
-                    exact_threshold=self._semantic_exact,
-                    likely_threshold=self._semantic_likely,
-                )
-                if m and not _already_matched(m.candidate_ticket_id, matches):
-                    matches.append(m)
-
-        # 3. Incident correlation
+        # 2. Incident correlation: checked before the semantic scan because a
+        # known incident decides the action (LINK_NOTIFY) on its own
         inc_match, inc_id = incident_match(
             ticket_id,
             account_id,
@@ -107,6 +150,30 @@ class DeduplicationService:
             self._get_active_incidents,
             self._link_to_incident,
         )
+
+        # 3. Semantic similarity (if we have embedding or embedding_fn); all
+        # candidates are scored in one batched matmul. Skipped when an incident
+        # linked, and for candidates that already matched EXACT on metadata.
+        if inc_match is None and candidates and (
+            current_embedding or self._embedding_fn or self._embedding_batch_fn
+        ):
+            for m in semantic_matches(
+                current_embedding,
+                cleaned_text,
+                [
+                    c
+                    for c in candidates
+                    if c.ticket_id != ticket_id and c.ticket_id not in seen
+                ],
+                self._embedding_fn,
+                exact_threshold=self._semantic_exact,
+                likely_threshold=self._semantic_likely,
+                embedding_batch_fn=self._embedding_batch_fn,
+            ):
+                if m.candidate_ticket_id not in seen:
+                    matches.append(m)
+                    seen.add(m.candidate_ticket_id)
+
         if inc_match:
             matches.append(inc_match)
             linked_incident_id = inc_id
@@ -164,7 +231,3 @@ class DeduplicationService:
             candidates=candidates,
             product=product,
         )
-
-
-def _already_matched(candidate_id: str, matches: list[DuplicateMatch]) -> bool:
-    return any(m.candidate_ticket_id == candidate_id for m in matches)
@@ -9,9 +9,19 @@ HTTP routes for each ingestion entry point.
 - POST /ingest/teams      → Microsoft Teams
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from ingestion.api.schemas import (
+    ChatPayload,
+    CRMPayload,
+    EmailPayload,
+    SlackPayload,
+    TeamsPayload,
+    TicketIngestResponse,
+    TicketSummary,
+    WebFormPayload,
+)
 from ingestion.schema import NormalizedTicket
 from ingestion.sources.email import EmailAdapter
 from ingestion.sources.web_form import WebFormAdapter
@@ -20,15 +30,15 @@ from ingestion.sources.crm import CRMImportAdapter
 from ingestion.sources.slack_teams import SlackTeamsAdapter
 
 
-def _ticket_response(ticket: NormalizedTicket) -> dict:
+def _ticket_response(ticket: NormalizedTicket) -> TicketSummary:
     """Serialize normalized ticket for API response."""
-    return {
-        "ticket_id": ticket.ticket_id,
-        "source": ticket.source.value,
-        "subject": ticket.subject,
-        "cleaned_text": ticket.cleaned_text[:200] + "..." if len(ticket.cleaned_text) > 200 else ticket.cleaned_text,
-        "received_at": ticket.received_at.isoformat(),
-    }
+    return TicketSummary(
+        ticket_id=ticket.ticket_id,
+        source=ticket.source.value,
+        subject=ticket.subject,
+        cleaned_text=ticket.cleaned_text[:200] + "..." if len(ticket.cleaned_text) > 200 else ticket.cleaned_text,
+        received_at=ticket.received_at.isoformat(),
+    )
 
 
 def build_router(
@@ -40,77 +50,99 @@ def build_router(
 ) -> APIRouter:
     router = APIRouter(prefix="/ingest", tags=["ingestion"])
 
-    @router.post("/web-form", response_model=dict)
-    async def ingest_web_form(request: Request):
+    @router.post(
+        "/web-form",
+        response_model=TicketIngestResponse,
+        response_model_exclude_none=True,
+    )
+    async def ingest_web_form(body: WebFormPayload):
         """Web form submission (JSON body with message, subject, email, etc.)."""
-        body = await request.json()
-        ticket = web_form_adapter.ingest(body)
-        return {"ok": True, "ticket": _ticket_response(ticket)}
+        payload = body.to_dict()
+        ticket = web_form_adapter.ingest(payload)
+        return TicketIngestResponse(ok=True, ticket=_ticket_response(ticket))
 
-    @router.post("/email", response_model=dict)
-    async def ingest_email(request: Request):
+    @router.post(
+        "/email",
+        response_model=TicketIngestResponse,
+        response_model_exclude_none=True,
+    )
+    async def ingest_email(body: EmailPayload):
         """Email webhook (e.g. SendGrid, Mailgun, SES inbound)."""
-        body = await request.json()
+        payload = body.to_dict()
         try:
-            ticket = email_adapter.ingest(body)
-            return {"ok": True, "ticket": _ticket_response(ticket)}
+            ticket = email_adapter.ingest(payload)
+            return TicketIngestResponse(ok=True, ticket=_ticket_response(ticket))
         except ValueError as e:
             return JSONResponse(
                 status_code=422,
                 content={"ok": False, "error": str(e)},
             )
 
-    @router.post("/chat", response_model=dict)
-    async def ingest_chat(request: Request):
+    @router.post(
+        "/chat",
+        response_model=TicketIngestResponse,
+        response_model_exclude_none=True,
+    )
+    async def ingest_chat(body: ChatPayload):
         """Chat / in-app support (Intercom, Zendesk Chat, etc.)."""
-        body = await request.json()
+        payload = body.to_dict()
         try:
-            ticket = chat_adapter.ingest(body)
-            return {"ok": True, "ticket": _ticket_response(ticket)}
+            ticket = chat_adapter.ingest(payload)
+            return TicketIngestResponse(ok=True, ticket=_ticket_response(ticket))
         except ValueError as e:
             return JSONResponse(
                 status_code=422,
                 content={"ok": False, "error": str(e)},
             )
 
-    @router.post("/crm", response_model=dict)
-    async def ingest_crm(request: Request):
+    @router.post(
+        "/crm",
+        response_model=TicketIngestResponse,
+        response_model_exclude_none=True,
+    )
+    async def ingest_crm(body: CRMPayload):
         """CRM import (Zendesk, Freshdesk, ServiceNow, etc.)."""
-        body = await request.json()
+        payload = body.to_dict()
         try:
-            ticket = crm_adapter.ingest(body)
-            return {"ok": True, "ticket": _ticket_response(ticket)}
+            ticket = crm_adapter.ingest(payload)
+            return TicketIngestResponse(ok=True, ticket=_ticket_response(ticket))
         except ValueError as e:
             return JSONResponse(
                 status_code=422,
                 content={"ok": False, "error": str(e)},
             )
 
-    @router.post("/slack", response_model=dict)
-    async def ingest_slack(request: Request):
+    @router.post(
+        "/slack",
+        response_model=TicketIngestResponse,
+        response_model_exclude_none=True,
+    )
+    async def ingest_slack(body: SlackPayload):
         """Slack event or message payload."""
-        body = await request.json()
+        payload = body.to_dict()
         try:
             # Force Slack source by ensuring platform or event shape
-            if isinstance(body, dict) and "platform" not in body:
-                body = {**body, "platform": "slack"}
-            ticket = slack_teams_adapter.ingest(body)
-            return {"ok": True, "ticket": _ticket_response(ticket)}
+            payload.setdefault("platform", "slack")
+            ticket = slack_teams_adapter.ingest(payload)
+            return TicketIngestResponse(ok=True, ticket=_ticket_response(ticket))
         except ValueError as e:
             return JSONResponse(
                 status_code=422,
                 content={"ok": False, "error": str(e)},
             )
 
-    @router.post("/teams", response_model=dict)
-    async def ingest_teams(request: Request):
+    @router.post(
+        "/teams",
+        response_model=TicketIngestResponse,
+        response_model_exclude_none=True,
+    )
+    async def ingest_teams(body: TeamsPayload):
         """Microsoft Teams activity or webhook payload."""
-        body = await request.json()
+        payload = body.to_dict()
         try:
-            if isinstance(body, dict) and "platform" not in body:
-                body = {**body, "platform": "teams"}
-            ticket = slack_teams_adapter.ingest(body)
-            return {"ok": True, "ticket": _ticket_response(ticket)}
+            payload.setdefault("platform", "teams")
+            ticket = slack_teams_adapter.ingest(payload)
+            return TicketIngestResponse(ok=True, ticket=_ticket_response(ticket))
         except ValueError as e:
             return JSONResponse(
                 status_code=422,
@@ -0,0 +1,63 @@
+"""
+Request and response bodies for the ingestion API.
+
+Source payloads are typed per route so FastAPI parses and validates the JSON
+body once; fields stay open (extra="allow") because each adapter accepts many
+vendor-specific shapes (see ingestion.sources).
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class SourcePayload(BaseModel):
+    """Any JSON object; keys are interpreted by the source adapter."""
+
+    model_config = {"extra": "allow"}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Payload as the plain dict the source adapters expect."""
+        return dict(self.model_extra or {})
+
+
+class WebFormPayload(SourcePayload):
+    """Web form submission: message, subject, email, name, company, etc."""
+
+
+class EmailPayload(SourcePayload):
+    """Email webhook: subject, body/text/html, from, message_id, attachments, etc."""
+
+
+class ChatPayload(SourcePayload):
+    """Chat / in-app message: message, user, conversation_id, channel, etc."""
+
+
+class CRMPayload(SourcePayload):
+    """CRM ticket record: description, subject, id, requester, created_at, etc."""
+
+
+class SlackPayload(SourcePayload):
+    """Slack event or simplified message: event/text, user, channel, ts."""
+
+
+class TeamsPayload(SourcePayload):
+    """Teams activity or webhook: text, from, channelId, conversation, id."""
+
+
+class TicketSummary(BaseModel):
+    """Normalized ticket as returned by the ingestion endpoints."""
+
+    ticket_id: str
+    source: str
+    subject: str
+    cleaned_text: str  # Truncated to 200 chars + "..."
+    received_at: str  # ISO 8601
+
+
+class TicketIngestResponse(BaseModel):
+    """Response body for every POST /ingest/* route."""
+
+    ok: bool
+    ticket: TicketSummary | None = None
+    error: str | None = None
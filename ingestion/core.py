@@ -5,15 +5,15 @@ Consumes payloads from any source adapter and produces NormalizedTicket,
 then enqueues or stores for the next pipeline stage (classification, etc.).
 """
 
-import uuid
-from datetime import datetime
+import secrets
+from datetime import datetime, timezone
 
 from ingestion.schema import CustomerMetadata, NormalizedTicket, TicketSource
 
 
 def assign_ticket_id() -> str:
     """Generate a unique ticket ID (e.g. for dedupe and linking)."""
-    return f"TKT-{uuid.uuid4().hex[:12].upper()}"
+    return f"TKT-{secrets.token_hex(6).upper()}"
 
 
 def clean_text(raw: str) -> str:
@@ -23,11 +23,10 @@ def clean_text(raw: str) -> str:
     """
     if not raw:
         return ""
-    text = raw.strip()
-    # Placeholder: add HTML strip, markdown normalization, etc.
-    while "  " in text:
-        text = text.replace("  ", " ")
-    return text
+    # Placeholder: add HTML strip, markdown normalization, etc. before this;
+    # keep split/join as the final single-pass whitespace collapse. Line breaks
+    # are kept: extraction relies on them (steps to reproduce, error lines).
+    return "\n".join(" ".join(line.split()) for line in raw.strip().splitlines())
 
 
 class IngestionService:
@@ -82,7 +81,7 @@ class IngestionService:
             cleaned_text=cleaned,
             subject=subject or "",
             customer=customer,
-            received_at=received_at or datetime.utcnow(),
+            received_at=received_at or datetime.now(timezone.utc),
             source_id=source_id,
             attachments=attachments or [],
             channel_metadata=channel_metadata or {},
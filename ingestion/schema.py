@@ -5,13 +5,18 @@ All entry point sources (Email, Web forms, Chat, CRM, Slack/Teams) produce
 tickets in this format for downstream classification, extraction, and routing.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
+def _utc_now() -> datetime:
+    """Current time as a tz-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class TicketSource(str, Enum):
     EMAIL = "email"
     WEB_FORM = "web_form"
@@ -43,7 +48,7 @@ class NormalizedTicket(BaseModel):
     - cleaned_text: Normalized text for classification/extraction (strip HTML, etc.).
     - subject: Title/summary when available (email subject, form title, thread title).
     - customer: Optional metadata from source or CRM.
-    - received_at: When the ticket was received by our system.
+    - received_at: When the ticket was received by our system (tz-aware UTC by default).
     - source_id: External ID from the source system (e.g. email message-id, Slack ts).
     - attachments: References to any attachments (URLs or storage keys).
     - channel_metadata: Source-specific fields (thread_id, channel, etc.).
@@ -55,7 +60,7 @@ class NormalizedTicket(BaseModel):
     cleaned_text: str
     subject: str = ""
     customer: CustomerMetadata = Field(default_factory=CustomerMetadata)
-    received_at: datetime = Field(default_factory=datetime.utcnow)
+    received_at: datetime = Field(default_factory=_utc_now)
     source_id: str | None = None
     attachments: list[str] = Field(default_factory=list)
     channel_metadata: dict[str, Any] = Field(default_factory=dict)
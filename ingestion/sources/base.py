@@ -5,13 +5,65 @@ Each source parses its native payload into a common dict/kwargs shape
 and calls the central IngestionService.ingest().
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+from dateutil import parser as _dateutil_parser
 
 from ingestion.core import IngestionService
 from ingestion.schema import NormalizedTicket
 
 
+def key_probe(keys: tuple[str, ...], default: Any = None) -> Callable[[dict[str, Any]], Any]:
+    """
+    Build `probe(d)` returning the first truthy d[key] over keys, else default
+    (same as chaining d.get(k) with `or`). The chain is generated once as
+    straight-line code, so adapters pay no per-call loop over the key tuple.
+    default must be a literal (None, "", {}); it is re-evaluated on each call.
+    """
+    chain = " or ".join(f"d.get({k!r})" for k in keys)
+    namespace: dict[str, Any] = {}
+    exec(f"def probe(d):\n    return {chain} or {default!r}\n", namespace)
+    return namespace["probe"]
+
+
+def intern_label(value: Any) -> Any:
+    """sys.intern for low-cardinality labels (channel, platform, CRM name); other values as-is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def drop_none(d: dict[str, Any]) -> dict[str, Any] | None:
+    """d without None values; None when nothing is left (e.g. all-empty channel_metadata)."""
+    kept = {k: v for k, v in d.items() if v is not None}
+    return kept or None
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_datetime(value: str) -> datetime | None:
+    # Bulk CRM/email exports repeat the same timestamp strings; datetimes are immutable.
+    # Only the ISO-8601 parse is cached: dateutil fills a partial string
+    # ("10:30", "Tuesday") from today's date, so its result would go stale.
+    try:
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return None
+
+
+def parse_datetime(value: Any) -> datetime | None:
+    """Parse a source timestamp: ISO-8601 fast path, dateutil for anything else."""
+    if isinstance(value, str):
+        parsed = _parse_iso_datetime(value)
+        if parsed is not None:
+            return parsed
+    try:
+        return _dateutil_parser.parse(value)
+    except Exception:
+        return None
+
+
 class BaseSourceAdapter(ABC):
     """Parse source-specific payload and call ingestion service."""
 
@@ -26,6 +78,20 @@ class BaseSourceAdapter(ABC):
         """
         ...
 
+    def parse_safe(self, payload: Any) -> dict[str, Any] | None:
+        """Like parse(), but returns None for non-dict payloads instead of raising."""
+        if payload.__class__ is dict or isinstance(payload, dict):
+            return self.parse(payload)
+        return None
+
+    def parse_many(self, payloads: Iterable[Any]) -> list[dict[str, Any]]:
+        """
+        parse() over a batch, in order. Runs in-process: a parse is a few dict
+        lookups, cheaper than pickling the payload to a worker and back.
+        """
+        parse = self.parse
+        return [parse(p) for p in payloads]
+
     def ingest(self, payload: Any) -> NormalizedTicket:
         """Parse payload and submit to ingestion service."""
         kwargs = self.parse(payload)
@@ -8,7 +8,12 @@ Supports conversation-style payloads with message body, user info, and thread co
 from typing import Any
 
 from ingestion.schema import TicketSource
-from ingestion.sources.base import BaseSourceAdapter
+from ingestion.sources.base import BaseSourceAdapter, drop_none, intern_label, key_probe
+
+_SOURCE = TicketSource.CHAT
+_get_body = key_probe(("message", "body", "text", "content"), "")
+_get_id = key_probe(("message_id", "id"))
+_get_conversation = key_probe(("conversation_id", "thread_id"))
 
 
 class ChatAdapter(BaseSourceAdapter):
@@ -23,19 +28,13 @@ class ChatAdapter(BaseSourceAdapter):
         - message_id / id: source_id
         - channel: e.g. "intercom", "zendesk_chat"
         """
-        if isinstance(payload, dict):
+        if payload.__class__ is dict or isinstance(payload, dict):
             return self._parse_dict(payload)
         raise ValueError("Chat payload must be a dict")
 
     def _parse_dict(self, d: dict[str, Any]) -> dict[str, Any]:
-        raw_text = (
-            d.get("message")
-            or d.get("body")
-            or d.get("text")
-            or d.get("content")
-            or ""
-        )
-        source_id = d.get("message_id") or d.get("id")
+        raw_text = _get_body(d)
+        source_id = _get_id(d)
         user = d.get("user") or {}
         if isinstance(user, dict):
             email = user.get("email") or d.get("email")
@@ -47,7 +46,7 @@ class ChatAdapter(BaseSourceAdapter):
             customer_id = d.get("user_id")
 
         return {
-            "source": TicketSource.CHAT,
+            "source": _SOURCE,
             "raw_text": raw_text,
             "subject": "",  # Chat often has no subject; use first line or leave empty
             "source_id": source_id,
@@ -55,9 +54,9 @@ class ChatAdapter(BaseSourceAdapter):
             "name": name,
             "customer_id": str(customer_id) if customer_id else None,
             "company": d.get("company") or (user.get("company") if isinstance(user, dict) else None),
-            "channel_metadata": {
-                "conversation_id": d.get("conversation_id") or d.get("thread_id"),
-                "channel": d.get("channel"),
-                "platform": d.get("platform"),
-            },
+            "channel_metadata": drop_none({
+                "conversation_id": _get_conversation(d),
+                "channel": intern_label(d.get("channel")),
+                "platform": intern_label(d.get("platform")),
+            }),
         }
@@ -8,7 +8,23 @@ Supports bulk or single-ticket import payloads with CRM-specific field mapping.
 from typing import Any
 
 from ingestion.schema import TicketSource
-from ingestion.sources.base import BaseSourceAdapter
+from ingestion.sources.base import (
+    BaseSourceAdapter,
+    drop_none,
+    intern_label,
+    key_probe,
+    parse_datetime,
+)
+
+_SOURCE = TicketSource.CRM_IMPORT
+_get_body = key_probe(("description", "body"))
+_get_subject = key_probe(("subject", "title"), "")
+_get_id = key_probe(("id", "ticket_id"), "")
+_get_requester = key_probe(("requester", "contact", "user"), {})
+_DATE_KEYS = ("created_at", "created", "created_date", "date")
+_get_account = key_probe(("account_id", "organization_id"))
+_get_plan = key_probe(("plan_tier", "plan"))
+_get_crm_source = key_probe(("crm_source", "source"))
 
 
 class CRMImportAdapter(BaseSourceAdapter):
@@ -25,22 +41,21 @@ class CRMImportAdapter(BaseSourceAdapter):
         - created_at / created: received_at
         - crm_source: "zendesk" | "freshdesk" | "servicenow" | "salesforce" | "hubspot"
         """
-        if isinstance(payload, dict):
+        if payload.__class__ is dict or isinstance(payload, dict):
             return self._parse_dict(payload)
         raise ValueError("CRM import payload must be a dict")
 
     def _parse_dict(self, d: dict[str, Any]) -> dict[str, Any]:
         raw_text = (
-            d.get("description")
-            or d.get("body")
+            _get_body(d)
             or (f"{d.get('subject', '')}\n\n{d.get('description', '')}".strip())
             or d.get("content")
             or ""
         )
-        subject = d.get("subject") or d.get("title") or ""
-        source_id = str(d.get("id") or d.get("ticket_id") or "")
+        subject = _get_subject(d)
+        source_id = str(_get_id(d))
 
-        requester = d.get("requester") or d.get("contact") or d.get("user") or {}
+        requester = _get_requester(d)
         if isinstance(requester, dict):
             email = requester.get("email") or d.get("requester_email")
             name = requester.get("name") or d.get("requester_name")
@@ -49,17 +64,14 @@ class CRMImportAdapter(BaseSourceAdapter):
             name = d.get("requester_name")
 
         received_at = None
-        for key in ("created_at", "created", "created_date", "date"):
+        for key in _DATE_KEYS:
             if d.get(key):
-                try:
-                    from dateutil import parser as date_parser
-                    received_at = date_parser.parse(d[key])
+                received_at = parse_datetime(d[key])
+                if received_at is not None:
                     break
-                except Exception:
-                    pass
 
         return {
-            "source": TicketSource.CRM_IMPORT,
+            "source": _SOURCE,
             "raw_text": raw_text,
             "subject": subject,
             "source_id": source_id or None,
@@ -67,13 +79,13 @@ class CRMImportAdapter(BaseSourceAdapter):
             "name": name,
             "company": d.get("company") or (requester.get("company") if isinstance(requester, dict) else None),
             "customer_id": str(d.get("requester_id") or requester.get("id") or "") or None,
-            "account_id": d.get("account_id") or d.get("organization_id"),
-            "plan_tier": d.get("plan_tier") or d.get("plan"),
+            "account_id": _get_account(d),
+            "plan_tier": _get_plan(d),
             "received_at": received_at,
-            "channel_metadata": {
-                "crm_source": d.get("crm_source") or d.get("source"),
-                "priority": d.get("priority"),
-                "status": d.get("status"),
-                "custom_fields": d.get("custom_fields") or {},
-            },
+            "channel_metadata": drop_none({
+                "crm_source": intern_label(_get_crm_source(d)),
+                "priority": intern_label(d.get("priority")),
+                "status": intern_label(d.get("status")),
+                "custom_fields": d.get("custom_fields") or None,
+            }),
         }
@@ -10,7 +10,14 @@ Supports:
 from typing import Any
 
 from ingestion.schema import TicketSource
-from ingestion.sources.base import BaseSourceAdapter
+from ingestion.sources.base import BaseSourceAdapter, drop_none, key_probe, parse_datetime
+
+_SOURCE = TicketSource.EMAIL
+_get_subject = key_probe(("subject", "Subject"), "")
+_get_body = key_probe(("body", "text", "plain_text", "html", "body_html"), "")
+_get_sender = key_probe(("from", "sender"), {})
+_get_id = key_probe(("message_id", "Message-Id", "id"))
+_get_date = key_probe(("received_at", "date"))
 
 
 class EmailAdapter(BaseSourceAdapter):
@@ -26,24 +33,17 @@ class EmailAdapter(BaseSourceAdapter):
         - attachments: list of {"filename", "url"} or URLs
         - received_at: ISO datetime string (optional)
         """
-        if isinstance(payload, dict):
+        if payload.__class__ is dict or isinstance(payload, dict):
             return self._parse_dict(payload)
         raise ValueError("Email payload must be a dict")
 
     def _parse_dict(self, d: dict[str, Any]) -> dict[str, Any]:
-        subject = d.get("subject") or d.get("Subject") or ""
-        body = (
-            d.get("body")
-            or d.get("text")
-            or d.get("plain_text")
-            or d.get("html")
-            or d.get("body_html")
-            or ""
-        )
+        subject = _get_subject(d)
+        body = _get_body(d)
         if isinstance(body, bytes):
             body = body.decode("utf-8", errors="replace")
 
-        sender = d.get("from") or d.get("sender") or {}
+        sender = _get_sender(d)
         if isinstance(sender, str):
             email = sender
             name = None
@@ -51,7 +51,7 @@ class EmailAdapter(BaseSourceAdapter):
             email = sender.get("email") or sender.get("address")
             name = sender.get("name")
 
-        source_id = d.get("message_id") or d.get("Message-Id") or d.get("id")
+        source_id = _get_id(d)
         attachments = d.get("attachments") or []
         if attachments and isinstance(attachments[0], dict):
             attachments = [
@@ -59,29 +59,21 @@ class EmailAdapter(BaseSourceAdapter):
                 for a in attachments
             ]
 
-        received_at = None
-        if d.get("received_at") or d.get("date"):
-            try:
-                from dateutil import parser as date_parser
-
-                received_at = date_parser.parse(
-                    d.get("received_at") or d.get("date")
-                )
-            except Exception:
-                pass
+        date_value = _get_date(d)
+        received_at = parse_datetime(date_value) if date_value else None
 
         return {
-            "source": TicketSource.EMAIL,
+            "source": _SOURCE,
             "raw_text": body,
             "subject": subject,
             "source_id": source_id,
             "email": email,
             "name": name,
             "attachments": attachments,
-            "channel_metadata": {
+            "channel_metadata": drop_none({
                 "to": d.get("to"),
                 "cc": d.get("cc"),
                 "reply_to": d.get("reply_to"),
-            },
+            }),
             "received_at": received_at,
         }
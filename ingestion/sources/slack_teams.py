@@ -8,7 +8,14 @@ Supports event payloads and simplified message payloads.
 from typing import Any
 
 from ingestion.schema import TicketSource
-from ingestion.sources.base import BaseSourceAdapter
+from ingestion.sources.base import BaseSourceAdapter, drop_none, intern_label, key_probe
+
+_SLACK = TicketSource.SLACK
+_TEAMS = TicketSource.TEAMS
+_get_slack_id = key_probe(("ts", "event_ts", "message_id"))
+_get_teams_id = key_probe(("id", "message_id"))
+_get_teams_user = key_probe(("from", "user"), {})
+_get_teams_channel = key_probe(("channelId", "channel_id"))
 
 
 class SlackTeamsAdapter(BaseSourceAdapter):
@@ -24,7 +31,7 @@ class SlackTeamsAdapter(BaseSourceAdapter):
         Teams: activity with text, from/user, channelId, id.
         Or simplified: { "text", "user_id", "channel_id", "platform": "slack"|"teams" }
         """
-        if isinstance(payload, dict):
+        if payload.__class__ is dict or isinstance(payload, dict):
             return self._parse_dict(payload)
         raise ValueError("Slack/Teams payload must be a dict")
 
@@ -38,22 +45,23 @@ class SlackTeamsAdapter(BaseSourceAdapter):
 
     def _parse_slack(self, d: dict[str, Any]) -> dict[str, Any]:
         event = d.get("event") or d
-        text = event.get("text") or d.get("text") or ""
-        source_id = event.get("ts") or d.get("ts") or d.get("event_ts") or d.get("message_id")
-        user_id = event.get("user") or d.get("user_id")
-        channel_id = event.get("channel") or event.get("channel_id") or d.get("channel_id")
+        event_get = event.get
+        text = event_get("text") or d.get("text") or ""
+        source_id = event_get("ts") or _get_slack_id(d)
+        user_id = event_get("user") or d.get("user_id")
+        channel_id = event_get("channel") or event_get("channel_id") or d.get("channel_id")
 
         return {
-            "source": TicketSource.SLACK,
+            "source": _SLACK,
             "raw_text": text,
             "subject": "",  # Or use channel name as context
             "source_id": str(source_id) if source_id else None,
             "customer_id": str(user_id) if user_id else None,
-            "channel_metadata": {
-                "channel_id": channel_id,
-                "thread_ts": event.get("thread_ts") or d.get("thread_ts"),
-                "team_id": event.get("team") or d.get("team_id"),
-            },
+            "channel_metadata": drop_none({
+                "channel_id": intern_label(channel_id),
+                "thread_ts": event_get("thread_ts") or d.get("thread_ts"),
+                "team_id": intern_label(event_get("team") or d.get("team_id")),
+            }),
         }
 
     def _parse_teams(self, d: dict[str, Any]) -> dict[str, Any]:
@@ -65,24 +73,29 @@ class SlackTeamsAdapter(BaseSourceAdapter):
         elif isinstance(msg, str):
             text = text or msg
 
-        source_id = d.get("id") or d.get("message_id")
-        user = d.get("from") or d.get("user") or {}
+        source_id = _get_teams_id(d)
+        user = _get_teams_user(d)
         if isinstance(user, dict):
             user_id = user.get("id") or user.get("userId")
             name = user.get("name")
         else:
             user_id = d.get("user_id")
             name = d.get("user_name")
+        conversation = d.get("conversation")
 
         return {
-            "source": TicketSource.TEAMS,
+            "source": _TEAMS,
             "raw_text": text,
             "subject": "",
             "source_id": str(source_id) if source_id else None,
             "customer_id": str(user_id) if user_id else None,
             "name": name,
-            "channel_metadata": {
-                "channel_id": d.get("channelId") or d.get("channel_id"),
-                "conversation_id": d.get("conversation", {}).get("id") if isinstance(d.get("conversation"), dict) else d.get("conversation_id"),
-            },
+            "channel_metadata": drop_none({
+                "channel_id": intern_label(_get_teams_channel(d)),
+                "conversation_id": (
+                    conversation.get("id")
+                    if isinstance(conversation, dict)
+                    else d.get("conversation_id")
+                ),
+            }),
         }
@@ -8,7 +8,12 @@ email, name, company, etc.
 from typing import Any
 
 from ingestion.schema import TicketSource
-from ingestion.sources.base import BaseSourceAdapter
+from ingestion.sources.base import BaseSourceAdapter, drop_none, key_probe
+
+_SOURCE = TicketSource.WEB_FORM
+_get_body = key_probe(("message", "description", "body", "content", "details"), "")
+_get_subject = key_probe(("subject", "title"), "")
+_get_id = key_probe(("submission_id", "id"))
 
 
 class WebFormAdapter(BaseSourceAdapter):
@@ -22,24 +27,17 @@ class WebFormAdapter(BaseSourceAdapter):
         - email, name, company: optional customer fields
         - account_id, customer_id: optional
         """
-        if isinstance(payload, dict):
+        if payload.__class__ is dict or isinstance(payload, dict):
             return self._parse_dict(payload)
         raise ValueError("Web form payload must be a dict")
 
     def _parse_dict(self, d: dict[str, Any]) -> dict[str, Any]:
-        raw_text = (
-            d.get("message")
-            or d.get("description")
-            or d.get("body")
-            or d.get("content")
-            or d.get("details")
-            or ""
-        )
-        subject = d.get("subject") or d.get("title") or ""
-        source_id = d.get("submission_id") or d.get("id")
+        raw_text = _get_body(d)
+        subject = _get_subject(d)
+        source_id = _get_id(d)
 
         return {
-            "source": TicketSource.WEB_FORM,
+            "source": _SOURCE,
             "raw_text": raw_text,
             "subject": subject,
             "source_id": source_id,
@@ -48,9 +46,9 @@ class WebFormAdapter(BaseSourceAdapter):
             "company": d.get("company"),
             "customer_id": d.get("customer_id"),
             "account_id": d.get("account_id"),
-            "channel_metadata": {
+            "channel_metadata": drop_none({
                 "form_name": d.get("form_name"),
                 "form_id": d.get("form_id"),
                 "referrer": d.get("referrer"),
-            },
+            }),
         }
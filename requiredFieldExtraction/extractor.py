@@ -5,12 +5,27 @@ Parses ticket text for product, issue_type, error_message, environment, urgency,
 timestamp, steps_to_reproduce, attachments_mentioned.
 """
 
-import json
 import re
-from typing import Callable
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Sequence
 
+import numpy as np
+import orjson
+
+from common.text import strip_fence
 from requiredFieldExtraction.schema import ExtractedFields
 
+try:
+    import re2 as _re2  # google-re2: linear-time matching, no lookaround
+except ImportError:
+    _re2 = None
+
+try:
+    from numba import njit as _njit
+except ImportError:  # optional JIT for the keyword prescan; str.__contains__ fallback
+    _njit = None
+
 
 # Environment patterns (prod/staging/dev)
 ENV_PATTERNS = [
@@ -53,6 +68,148 @@ ATTACHMENT_PATTERNS = [
     r"(\w+\.(?:pdf|log|csv|png|txt|xlsx?))\b",
 ]
 
+# Timestamp (simple patterns)
+TIMESTAMP_PATTERN = r"\b(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}|(?:at|since|on)\s+[\w\d:]+)\b"
+
+
+# Compiled once at import. With RE2 installed, ASCII text uses an RE2-compiled
+# set (bounded worst case on long or adversarial text); RE2's \w, \b and \s
+# are ASCII-only, so non-ASCII text always uses the stdlib set. Steps patterns
+# use lookaround, so they always use re.
+# Environment patterns are fused into one alternation with a named group per
+# pattern; the lowest-index group seen wins, matching the priority order of
+# ENV_PATTERNS. Urgency high/low are each one alternation (only "does any
+# match" matters). Environment and urgency only yield labels, so for ASCII
+# text they run without re.I over the pre-lowered text; non-ASCII text keeps
+# re.I over the original (lowering can split a character, e.g. "İ" -> "i̇",
+# and move a \b). Error/steps/attachment patterns keep
+# their list order and group numbers, so they stay individually compiled.
+_Patterns = namedtuple(
+    "_Patterns", ["env", "urgency_high", "urgency_low", "errors", "timestamp", "attachments"]
+)
+
+
+def _compile_patterns(engine, label_flags: str) -> _Patterns:
+    def compile_(pattern: str, flags: str = "i"):
+        return engine.compile(f"(?{flags}){pattern}" if flags else pattern)
+
+    return _Patterns(
+        env=compile_(
+            "|".join(f"(?P<env{i}>{p})" for i, (p, _) in enumerate(ENV_PATTERNS)), label_flags
+        ),
+        urgency_high=compile_("|".join(f"(?:{p})" for p in URGENCY_HIGH), label_flags),
+        urgency_low=compile_("|".join(f"(?:{p})" for p in URGENCY_LOW), label_flags),
+        errors=[compile_(p, "im") for p in ERROR_PATTERNS],
+        timestamp=compile_(TIMESTAMP_PATTERN),
+        attachments=[compile_(p) for p in ATTACHMENT_PATTERNS],
+    )
+
+
+_PATTERNS = _compile_patterns(re, "i")
+_ASCII_PATTERNS = _compile_patterns(_re2 or re, "")
+_ENV_BY_GROUP = {f"env{i}": (i, env) for i, (_, env) in enumerate(ENV_PATTERNS)}
+_STEPS_RES = [re.compile(p, re.I | re.S) for p in STEPS_PATTERNS]
+
+# Literal substrings (lowercase) at least one of which must occur for a pattern
+# group to match; groups whose keywords are all absent skip their regexes.
+_ENV_KW = ("prod", "stag", "dev", "local", "env")
+_URGENCY_HIGH_KW = (
+    "urgent", "critical", "asap", "immediately", "emergency", "blocking", "down",
+    "cannot", "can't", "unable",
+)
+_URGENCY_LOW_KW = ("when you can", "no rush", "low priority", "nice to have")
+_ERROR_KW = ("error", "exception", "failed")
+_STEPS_KW = ("step", "reproduce")
+_ATTACHMENT_KW = (
+    "attach", "uploaded", "enclosed", ".pdf", ".log", ".csv", ".png", ".txt", ".xls",
+)
+# TIMESTAMP_PATTERN needs a date separator or one of its lead-in words
+_TIMESTAMP_KW = ("-", "/", "at", "on", "since")
+# ERROR_PATTERNS[0] ("401 Unauthorized") has no literal keyword, only digits
+_ERROR_CODE_RE = re.compile(r"\d{3}")
+
+
+_KEYWORD_GROUPS = (
+    _ENV_KW,
+    _URGENCY_HIGH_KW,
+    _URGENCY_LOW_KW,
+    _ERROR_KW,
+    _TIMESTAMP_KW,
+    _STEPS_KW,
+    _ATTACHMENT_KW,
+)
+
+
+def _has_any(hay: str, keywords: tuple[str, ...]) -> bool:
+    for kw in keywords:
+        if kw in hay:
+            return True
+    return False
+
+
+if _njit is not None:
+
+    def _keyword_tables(groups: tuple[tuple[str, ...], ...]):
+        """Keyword bytes padded into a 2-D table, bucketed by first byte (CSR offsets)."""
+        words = [(g, kw.encode()) for g, kws in enumerate(groups) for kw in kws]
+        words.sort(key=lambda w: w[1][0])
+        table = np.zeros((len(words), max(len(w) for _, w in words)), dtype=np.uint8)
+        lengths = np.empty(len(words), dtype=np.int64)
+        group_of = np.empty(len(words), dtype=np.int64)
+        starts = np.zeros(257, dtype=np.int64)
+        for i, (g, w) in enumerate(words):
+            table[i, : len(w)] = np.frombuffer(w, dtype=np.uint8)
+            lengths[i] = len(w)
+            group_of[i] = g
+            starts[w[0] + 1] += 1
+        return table, lengths, group_of, np.cumsum(starts)
+
+    _KW_TABLE, _KW_LENGTHS, _KW_GROUP, _KW_STARTS = _keyword_tables(_KEYWORD_GROUPS)
+
+    @_njit(cache=True)
+    def _scan_keywords(buf, table, lengths, group_of, starts, n_groups):
+        # One pass over the text; at each byte only keywords starting with it are compared.
+        found = np.zeros(n_groups, dtype=np.bool_)
+        n = buf.shape[0]
+        for p in range(n):
+            c = buf[p]
+            for k in range(starts[c], starts[c + 1]):
+                g = group_of[k]
+                length = lengths[k]
+                if found[g] or p + length > n:
+                    continue
+                hit = True
+                for q in range(1, length):
+                    if buf[p + q] != table[k, q]:
+                        hit = False
+                        break
+                if hit:
+                    found[g] = True
+        return found
+
+    def _keyword_hits(lower: str) -> list[bool]:
+        buf = np.frombuffer(lower.encode(), dtype=np.uint8)
+        return _scan_keywords(
+            buf, _KW_TABLE, _KW_LENGTHS, _KW_GROUP, _KW_STARTS, len(_KEYWORD_GROUPS)
+        ).tolist()
+
+else:
+
+    def _keyword_hits(lower: str) -> list[bool]:
+        return [_has_any(lower, kws) for kws in _KEYWORD_GROUPS]
+
+
+def _match_environment(env_re, text: str) -> str | None:
+    """Environment label of the highest-priority ENV_PATTERNS entry found in text."""
+    best: tuple[int, str] | None = None
+    for m in env_re.finditer(text):
+        found = _ENV_BY_GROUP[m.lastgroup]
+        if best is None or found[0] < best[0]:
+            best = found
+            if found[0] == 0:
+                break
+    return best[1] if best else None
+
 
 def _rule_based_extract(text: str) -> ExtractedFields:
     """Extract fields using regex and heuristics when LLM is not used."""
@@ -61,83 +218,98 @@ def _rule_based_extract(text: str) -> ExtractedFields:
 
     lower = text.strip().lower()
     fields = ExtractedFields()
+    if text.isascii():
+        patterns, label_text = _ASCII_PATTERNS, lower
+    else:
+        patterns, label_text = _PATTERNS, text
+    (
+        env_kw,
+        high_kw,
+        low_kw,
+        error_kw,
+        timestamp_kw,
+        steps_kw,
+        attachment_kw,
+    ) = _keyword_hits(lower)
 
     # Environment
-    for pattern, env in ENV_PATTERNS:
-        if re.search(pattern, text, re.I):
-            fields.environment = env
-            break
+    if env_kw:
+        fields.environment = _match_environment(patterns.env, label_text)
 
     # Urgency
-    for pattern in URGENCY_HIGH:
-        if re.search(pattern, text, re.I):
-            fields.urgency = "High"
-            break
-    if not fields.urgency:
-        for pattern in URGENCY_LOW:
-            if re.search(pattern, text, re.I):
-                fields.urgency = "Low"
-                break
-    if not fields.urgency:
+    if high_kw and patterns.urgency_high.search(label_text):
+        fields.urgency = "High"
+    elif low_kw and patterns.urgency_low.search(label_text):
+        fields.urgency = "Low"
+    else:
         fields.urgency = "Medium"
 
     # Error message (first match)
-    for pattern in ERROR_PATTERNS:
-        m = re.search(pattern, text, re.I | re.M)
-        if m:
-            fields.error_message = m.group(1).strip()[:500]
-            break
+    if error_kw or _ERROR_CODE_RE.search(text):
+        for pattern in patterns.errors:
+            m = pattern.search(text)
+            if m:
+                fields.error_message = m.group(1).strip()[:500]
+                break
 
     # Timestamp (simple patterns)
-    ts_m = re.search(
-        r"\b(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}|(?:at|since|on)\s+[\w\d:]+)\b",
-        text,
-        re.I,
-    )
+    ts_m = patterns.timestamp.search(text) if timestamp_kw else None
     if ts_m:
         fields.timestamp = ts_m.group(1).strip()
 
     # Steps to reproduce
-    for pattern in STEPS_PATTERNS:
-        m = re.search(pattern, text, re.I | re.S)
-        if m:
-            steps = (m.group(2) if m.lastindex and m.lastindex >= 2 else m.group(1)).strip()
-            fields.steps_to_reproduce = steps[:1000]
-            break
-
-    # Attachments mentioned
-    mentioned = []
-    for pattern in ATTACHMENT_PATTERNS:
-        for m in re.finditer(pattern, text, re.I):
-            g = m.group(1).strip() if m.lastindex >= 1 else m.group(0).strip()
-            if g and g not in mentioned:
-                mentioned.append(g[:200])
-    if mentioned:
-        fields.attachments_mentioned = mentioned[:10]
+    if steps_kw:
+        for pattern in _STEPS_RES:
+            m = pattern.search(text)
+            if m:
+                steps = (m.group(2) if m.lastindex and m.lastindex >= 2 else m.group(1)).strip()
+                fields.steps_to_reproduce = steps[:1000]
+                break
+
+    # Attachments mentioned (first 10 distinct, in pattern then text order)
+    if attachment_kw:
+        mentioned: dict[str, None] = {}
+        for pattern in patterns.attachments:
+            for m in pattern.finditer(text):
+                g = (m.group(1) if m.lastindex else m.group(0)).strip()[:200]
+                if g and g not in mentioned:
+                    mentioned[g] = None
+                    if len(mentioned) == 10:
+                        break
+            if len(mentioned) == 10:
+                break
+        if mentioned:
+            fields.attachments_mentioned = list(mentioned)
 
     return fields
 
 
+# String keys taken from the LLM response (plus attachments_mentioned);
+# customer fields come from ticket metadata.
+_LLM_STR_FIELDS = (
+    "product",
+    "issue_type",
+    "error_message",
+    "environment",
+    "urgency",
+    "timestamp",
+    "steps_to_reproduce",
+)
+
+
 def _parse_extraction_json(raw: str) -> ExtractedFields | None:
-    """Parse LLM JSON into ExtractedFields."""
-    raw = raw.strip()
-    if raw.startswith("```"):
-        raw = re.sub(r"^```\w*\n?", "", raw)
-        raw = re.sub(r"\n?```\s*$", "", raw)
+    """Parse LLM JSON into ExtractedFields (values normalized here, so construction skips validation)."""
+    raw = strip_fence(raw.strip())
     try:
-        data = json.loads(raw)
-        return ExtractedFields(
-            product=_str(data.get("product")),
-            issue_type=_str(data.get("issue_type")),
-            error_message=_str(data.get("error_message")),
-            environment=_str(data.get("environment")),
-            urgency=_str(data.get("urgency")),
-            timestamp=_str(data.get("timestamp")),
-            steps_to_reproduce=_str(data.get("steps_to_reproduce")),
-            attachments_mentioned=_str_list(data.get("attachments_mentioned")),
-        )
-    except (json.JSONDecodeError, ValueError, KeyError):
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return None
+    if not isinstance(data, dict):
+        return None
+    return ExtractedFields.model_construct(
+        **{k: _str(data.get(k)) for k in _LLM_STR_FIELDS},
+        attachments_mentioned=_str_list(data.get("attachments_mentioned")),
+    )
 
 
 def _str(v: object) -> str | None:
@@ -148,20 +320,34 @@ def _str(v: object) -> str | None:
 
 
 def _str_list(v: object) -> list[str]:
-    if v is None:
+    if not isinstance(v, list):
         return []
-    if isinstance(v, list):
-        return [str(x).strip() for x in v if str(x).strip()][:20]
-    return []
+    return [s for s in (str(x).strip() for x in v) if s][:20]
+
+
+# Below this many texts extract_batch() stays in-process: pickling results back
+# from workers (and starting them, on first use) outweighs the parallel scan.
+_PARALLEL_MIN_TEXTS = 512
 
 
 class FieldExtractor:
     """
     Extract required fields from ticket text; optional LLM with rule-based fallback.
+
+    llm_batch_fn: optional batch variant of llm_fn (list[str] -> list[str]);
+    extract_many() sends all prompts in one call when given.
+    The worker processes started by extract_batch() are kept for later calls
+    and released by close(), or by using the extractor as a context manager.
     """
 
-    def __init__(self, llm_fn: Callable[[str], str] | None = None):
+    def __init__(
+        self,
+        llm_fn: Callable[[str], str] | None = None,
+        llm_batch_fn: Callable[[list[str]], list[str]] | None = None,
+    ):
         self._llm = llm_fn
+        self._llm_batch = llm_batch_fn
+        self._pool: ProcessPoolExecutor | None = None
 
     def extract(self, ticket_text: str) -> ExtractedFields:
         """Extract fields from ticket body; use LLM if available else rules."""
@@ -178,3 +364,72 @@ class FieldExtractor:
             except Exception:
                 pass
         return _rule_based_extract(text)
+
+    def extract_many(self, ticket_texts: list[str]) -> list[ExtractedFields]:
+        """
+        Extract fields for several tickets, in order. With llm_batch_fn all prompts
+        go out in one call; responses that fail to parse fall back to rules per item.
+        """
+        if not self._llm_batch:
+            return [self.extract(t) for t in ticket_texts]
+        from requiredFieldExtraction.prompts import EXTRACTION_PROMPT
+
+        texts = [(t or "").strip() for t in ticket_texts]
+        try:
+            responses = self._llm_batch(
+                [EXTRACTION_PROMPT.format(ticket_text=t[:6000]) for t in texts]
+            )
+            if len(responses) != len(texts):
+                raise ValueError("llm_batch_fn returned a different number of responses")
+        except Exception:
+            responses = [None] * len(texts)
+        out: list[ExtractedFields] = []
+        for text, response in zip(texts, responses):
+            result = None
+            if response is not None:
+                try:
+                    result = _parse_extraction_json(response)
+                except Exception:
+                    result = None
+            out.append(result if result is not None else _rule_based_extract(text))
+        return out
+
+    def extract_batch(
+        self,
+        ticket_texts: Sequence[str],
+        workers: int | None = None,
+        chunksize: int = 64,
+        executor: Executor | None = None,
+    ) -> list[ExtractedFields]:
+        """
+        Rule-based extraction for a bulk import, spread over worker processes
+        (the regex scan is CPU-bound). Runs on executor when given, else on this
+        extractor's own process pool, started with `workers` processes on first
+        use. Batches under _PARALLEL_MIN_TEXTS, workers=1, or an LLM-backed
+        extractor go through extract_many() in-process.
+        """
+        if (
+            self._llm
+            or self._llm_batch
+            or workers == 1
+            or len(ticket_texts) < _PARALLEL_MIN_TEXTS
+        ):
+            return self.extract_many(list(ticket_texts))
+        if executor is None:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=workers)
+            executor = self._pool
+        texts = [(t or "").strip() for t in ticket_texts]
+        return list(executor.map(_rule_based_extract, texts, chunksize=chunksize))
+
+    def close(self) -> None:
+        """Shut down the worker processes started by extract_batch()."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "FieldExtractor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -9,6 +9,13 @@ from requiredFieldExtraction.schema import ExtractedFields, ExtractionResult
 from requiredFieldExtraction.extractor import FieldExtractor
 
 
+def _ticket_text(ticket) -> str:
+    text = ticket.cleaned_text or ""
+    if ticket.subject:
+        text = f"{ticket.subject}\n\n{text}".strip()
+    return text
+
+
 class ExtractionService:
     """
     Required field extraction (README §2).
@@ -27,12 +34,16 @@ class ExtractionService:
 
         ticket: from ingestion (ticket_id, cleaned_text, subject, customer).
         """
-        text = ticket.cleaned_text or ""
-        if ticket.subject:
-            text = f"{ticket.subject}\n\n{text}".strip()
+        fields = self._extractor.extract(_ticket_text(ticket))
+        return self._enrich(ticket, fields)
 
-        fields = self._extractor.extract(text)
+    def extract_many(self, tickets: list["NormalizedTicket"]) -> list[ExtractionResult]:  # type: ignore[name-defined]
+        """Batch variant of extract(); uses the extractor's llm_batch_fn when set."""
+        fields = self._extractor.extract_many([_ticket_text(t) for t in tickets])
+        return [self._enrich(t, f) for t, f in zip(tickets, fields)]
 
+    def _enrich(self, ticket, fields: ExtractedFields) -> ExtractionResult:
+        """Merge ticket customer metadata and attachments into extracted fields."""
         # Merge customer metadata (README: data enrichment via CRM lookup, plan tier)
         customer = getattr(ticket, "customer", None)
         if customer is not None:
@@ -45,14 +56,14 @@ class ExtractionService:
             # Plan tier is enrichment-only; could add to schema if we extend ExtractedFields
             # for now customer.plan_tier is available on ticket for routing
 
-        # Attachments: merge any from ticket.attachments if not already in mentioned
+        # Attachments: append ticket.attachments not already mentioned (keeps order)
         ticket_attachments = getattr(ticket, "attachments", None) or []
         if ticket_attachments:
-            existing = set(fields.attachments_mentioned or [])
+            merged = dict.fromkeys(fields.attachments_mentioned or ())
             for a in ticket_attachments:
-                if a and a not in existing:
-                    existing.add(a)
-            fields.attachments_mentioned = list(existing)[:20]
+                if a:
+                    merged.setdefault(a)
+            fields.attachments_mentioned = list(merged)[:20]
 
         return ExtractionResult(ticket_id=ticket.ticket_id, fields=fields)
 
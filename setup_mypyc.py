@@ -0,0 +1,22 @@
+"""
+Optional C build of the category keyword scorer with mypyc.
+
+    pip install mypy
+    python setup_mypyc.py build_ext --inplace
+
+This compiles ticketClassification/_keyword_scoring.py into an extension module
+next to it, which Python then imports instead of the .py file. Without the
+build (or after deleting the .so), the same module runs as plain Python.
+"""
+
+from mypyc.build import mypycify
+from setuptools import setup
+
+setup(
+    name="ticketai-keyword-scoring",
+    ext_modules=mypycify(
+        # Only this module is compiled; imported modules are not type-checked
+        ["--follow-imports=silent", "ticketClassification/_keyword_scoring.py"]
+    ),
+    py_modules=[],
+)
@@ -0,0 +1,42 @@
+"""Category keyword scoring: the table and automaton loops must agree."""
+
+import unittest
+
+from ticketClassification import category_model
+from ticketClassification._keyword_scoring import automaton_scores, best_index, table_scores
+
+_TEXTS = [
+    "i can't login, password reset fails with error 500",
+    "please add support for webhook retries in the api",
+    "invoice charged twice on my credit card; refund?",
+    "loginbilling apis_ error",
+    "résumé upload: déjà vu bug",
+    "",
+]
+
+
+class KeywordScoringTests(unittest.TestCase):
+    def test_automaton_matches_table_scan(self):
+        if category_model._KEYWORD_AUTOMATON is None:
+            self.skipTest("pyahocorasick not installed")
+        n = len(category_model._CAT_BY_INDEX)
+        for lower in _TEXTS:
+            with self.subTest(text=lower):
+                self.assertEqual(
+                    automaton_scores(lower, category_model._KEYWORD_AUTOMATON.iter(lower), n),
+                    table_scores(
+                        lower,
+                        set(category_model._tokenize(lower)),
+                        category_model._KEYWORD_TABLE,
+                        n,
+                    ),
+                )
+
+    def test_best_index_prefers_earliest_tie(self):
+        self.assertEqual(best_index([0.0, 1.5, 1.5, 1.0]), 1)
+        self.assertEqual(best_index([0.0, 0.0]), 0)
+        self.assertEqual(best_index([2.0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""ClassificationService result cache: LLM failures must not be cached."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from ticketClassification.category_model import CategoryModel
+from ticketClassification.service import ClassificationService
+from ticketClassification.severity_model import SeverityModel
+
+_TICKET = SimpleNamespace(ticket_id="t1", subject="", cleaned_text="the export looks odd")
+
+
+def _flaky_llm(response: str):
+    calls = []
+
+    def llm(prompt: str) -> str:
+        calls.append(prompt)
+        if len(calls) == 1:
+            raise TimeoutError("llm down")
+        return response
+
+    return llm, calls
+
+
+class FallbackCacheTests(unittest.TestCase):
+    def test_fallback_result_is_not_cached(self):
+        llm, calls = _flaky_llm('{"category": "technical_bug", "confidence": 0.95}')
+        service = ClassificationService(category_model=CategoryModel(llm_fn=llm))
+        first = service.classify(_TICKET)
+        self.assertEqual(service.cache_info().currsize, 0)
+        second = service.classify(_TICKET)
+        self.assertEqual(len(calls), 2)
+        self.assertNotEqual(first.category.category, second.category.category)
+        self.assertEqual(second.category.category.value, "technical_bug")
+        self.assertEqual(service.cache_info().currsize, 1)
+
+    def test_async_fallback_result_is_not_cached(self):
+        llm, calls = _flaky_llm('{"severity": "P2", "reason": "degraded"}')
+
+        async def allm(prompt: str) -> str:
+            return llm(prompt)
+
+        service = ClassificationService(severity_model=SeverityModel(allm_fn=allm))
+        asyncio.run(service.aclassify(_TICKET))
+        self.assertEqual(service.cache_info().currsize, 0)
+        result = asyncio.run(service.aclassify(_TICKET))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(result.severity.severity.value, "P2")
+        self.assertEqual(service.cache_info().currsize, 1)
+
+
+class CloseTests(unittest.TestCase):
+    def test_context_manager_shuts_down_worker_threads(self):
+        category_llm = lambda prompt: '{"category": "technical_bug", "confidence": 0.95}'
+        severity_llm = lambda prompt: '{"severity": "P2", "reason": "degraded"}'
+        with ClassificationService(
+            category_model=CategoryModel(llm_fn=category_llm),
+            severity_model=SeverityModel(llm_fn=severity_llm),
+        ) as service:
+            service.classify(_TICKET)
+            pool = service._pool
+            self.assertIsNotNone(pool)
+        self.assertIsNone(service._pool)
+        self.assertTrue(pool._shutdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Similarity kernels must agree whichever optional backend is installed."""
+
+import unittest
+from contextlib import nullcontext
+from unittest import mock
+
+import numpy as np
+
+from deduplication import matchers
+from deduplication.schema import ProcessedTicketView
+
+
+def _backends():
+    # Optional kernels as installed, then the pure NumPy path
+    yield "installed", nullcontext()
+    yield "numpy", mock.patch.multiple(matchers, _simsimd=None, _cos_numba=None)
+
+
+class CosineSimilarityTests(unittest.TestCase):
+    def test_zero_vectors_score_zero(self):
+        zero = np.zeros(4, dtype=np.float32)
+        unit = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+        for name, patch in _backends():
+            with self.subTest(backend=name), patch:
+                self.assertEqual(matchers.cosine_similarity(zero, zero), 0.0)
+                self.assertEqual(matchers.cosine_similarity([0.0, 0.0], [0.0, 0.0]), 0.0)
+                self.assertEqual(matchers.cosine_similarity(zero, unit), 0.0)
+                self.assertAlmostEqual(matchers.cosine_similarity(unit, unit), 1.0, places=6)
+
+
+class ScoreCandidatesTests(unittest.TestCase):
+    C = np.array([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [1.0, 1.0, 0.0]], dtype=np.float32)
+
+    def test_zero_vectors_score_zero(self):
+        zero = np.zeros(3, dtype=np.float32)
+        query = np.array([3.0, 0.0, 0.0], dtype=np.float32)
+        for name, patch in _backends():
+            with self.subTest(backend=name), patch:
+                np.testing.assert_allclose(
+                    matchers._score_candidates_numpy(zero, self.C), [0.0, 0.0, 0.0]
+                )
+                np.testing.assert_allclose(
+                    matchers._score_candidates_numpy(query, self.C),
+                    [0.0, 1.0, 2**-0.5],
+                    rtol=1e-6,
+                )
+                np.testing.assert_allclose(
+                    matchers._score_candidates_int8(
+                        zero.astype(np.int8), self.C.astype(np.int8)
+                    ),
+                    [0.0, 0.0, 0.0],
+                )
+
+    def test_normalized_is_a_plain_dot_product(self):
+        query = np.array([3.0, 0.0, 0.0], dtype=np.float32)
+        for name, patch in _backends():
+            with self.subTest(backend=name), patch:
+                np.testing.assert_allclose(
+                    matchers._score_candidates_numpy(query, self.C, normalized=True),
+                    [0.0, 6.0, 3.0],
+                )
+
+
+class Int8ScoringTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.query = rng.normal(size=64).astype(np.float32)
+        # Near-duplicates of the query plus unrelated vectors
+        noise = rng.normal(size=(12, 64)).astype(np.float32)
+        scale = np.linspace(0.05, 3.0, 12, dtype=np.float32)[:, None]
+        self.rows = self.query + noise * scale
+
+    def test_int8_scores_track_float32(self):
+        float_scores = matchers._score_candidates_numpy(self.query, self.rows)
+        q_i8, _ = matchers.quantize_embedding(self.query)
+        C_i8 = np.stack(
+            [np.frombuffer(matchers.quantize_embedding(r)[0], dtype=np.int8) for r in self.rows]
+        )
+        for name, patch in _backends():
+            with self.subTest(backend=name), patch:
+                i8_scores = matchers._score_candidates_int8(
+                    np.frombuffer(q_i8, dtype=np.int8), C_i8
+                )
+                np.testing.assert_allclose(i8_scores, float_scores, atol=0.01)
+
+    def test_quantize_round_trip(self):
+        q_i8, scale = matchers.quantize_embedding(self.query)
+        restored = np.frombuffer(q_i8, dtype=np.int8) * scale
+        np.testing.assert_allclose(restored, self.query, atol=scale / 2 + 1e-6)
+        self.assertEqual(matchers.quantize_embedding([0.0, 0.0]), (b"\x00\x00", 0.0))
+
+    def test_mixed_candidates_come_back_in_candidate_order(self):
+        # Least similar first, so candidate order differs from score order
+        candidates = []
+        for i, row in enumerate(self.rows[5::-1]):
+            if i % 2:
+                q_i8, scale = matchers.quantize_embedding(row)
+                view = ProcessedTicketView(
+                    ticket_id=f"c{i}", embedding_i8=q_i8, embedding_scale=scale
+                )
+            else:
+                view = ProcessedTicketView(ticket_id=f"c{i}", embedding=row.tolist())
+            candidates.append(view)
+        for name, patch in _backends():
+            with self.subTest(backend=name), patch:
+                found = matchers.semantic_matches(
+                    self.query.tolist(),
+                    "",
+                    candidates,
+                    None,
+                    exact_threshold=0.99,
+                    likely_threshold=0.3,
+                )
+                self.assertEqual(
+                    [m.candidate_ticket_id for m in found], [f"c{i}" for i in range(6)]
+                )
+                np.testing.assert_allclose(
+                    [m.similarity_score for m in found],
+                    matchers._score_candidates_numpy(self.query, self.rows[5::-1]),
+                    atol=0.01,
+                )
+
+if __name__ == "__main__":
+    unittest.main()
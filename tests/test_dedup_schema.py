@@ -0,0 +1,68 @@
+"""ProcessedTicketView derived values: kept out of model state, naive times read as UTC."""
+
+import os
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from deduplication.matchers import candidates_in_timeframe
+from deduplication.schema import ProcessedTicketView
+
+
+class ViewCacheTests(unittest.TestCase):
+    def test_equality_after_scoring(self):
+        a = ProcessedTicketView(ticket_id="t1", embedding=[1.0, 0.0])
+        b = ProcessedTicketView(ticket_id="t1", embedding=[1.0, 0.0])
+        a.embedding_unit, b.embedding_unit
+        self.assertEqual(a, b)
+        candidates = [b]
+        self.assertIn(a, candidates)
+        candidates.remove(a)
+        self.assertEqual(candidates, [])
+
+    def test_model_copy_update_recomputes(self):
+        view = ProcessedTicketView(ticket_id="t1", embedding=[1.0, 0.0], error_message="A")
+        view.embedding_unit, view.normalized_error
+        copy = view.model_copy(update={"embedding": [0.0, 2.0], "error_message": "B"})
+        np.testing.assert_allclose(copy.embedding_unit, [0.0, 1.0])
+        self.assertEqual(copy.normalized_error, "b")
+        np.testing.assert_allclose(view.embedding_unit, [1.0, 0.0])
+
+    def test_model_construct_derives_values(self):
+        view = ProcessedTicketView.model_construct(
+            ticket_id="t1", embedding=[3.0, 4.0], error_message=" Bad  Gateway"
+        )
+        np.testing.assert_allclose(view.embedding_unit, [0.6, 0.8])
+        self.assertEqual(view.normalized_error, "bad gateway")
+        self.assertIsNone(view.received_at_ts)
+
+
+
+class NaiveReceivedAtTests(unittest.TestCase):
+    def setUp(self):
+        # A host far from UTC, so reading naive values as local time would shift them
+        self._tz = os.environ.get("TZ")
+        os.environ["TZ"] = "Asia/Kolkata"
+        time.tzset()
+
+    def tearDown(self):
+        if self._tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = self._tz
+        time.tzset()
+
+    def test_naive_received_at_is_utc(self):
+        now = datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc)
+        naive = ProcessedTicketView(
+            ticket_id="old", received_at=(now - timedelta(minutes=10)).replace(tzinfo=None)
+        )
+        self.assertEqual(naive.received_at_ts, now.timestamp() - 600)
+        self.assertEqual(candidates_in_timeframe(now, [naive]), [naive])
+        self.assertEqual(candidates_in_timeframe(now.replace(tzinfo=None), [naive]), [naive])
+
+
+if __name__ == "__main__":
+    unittest.main()
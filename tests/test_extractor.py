@@ -0,0 +1,24 @@
+"""Rule-based extraction regressions: captures must follow stdlib re semantics."""
+
+import unittest
+
+from requiredFieldExtraction.extractor import _rule_based_extract
+
+
+class NonAsciiExtractionTests(unittest.TestCase):
+    # RE2's \w is ASCII-only; these captures must not stop at the accented letter.
+    def test_error_message_keeps_non_ascii_word(self):
+        self.assertEqual(
+            _rule_based_extract("Got 500 NAÏVE today").error_message, "500 NAÏVE today"
+        )
+
+    def test_timestamp_keeps_non_ascii_word(self):
+        self.assertEqual(_rule_based_extract("broke at\tnaïve").timestamp, "at\tnaïve")
+
+    def test_environment_on_unlowered_text(self):
+        # "İ".lower() is two characters and would put a \b before "staging"
+        self.assertIsNone(_rule_based_extract("İstaging box").environment)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""SemanticCache hits, misses and eviction on the hnswlib and NumPy paths."""
+
+import unittest
+from contextlib import nullcontext
+from unittest import mock
+
+from ticketClassification import semantic_cache
+from ticketClassification.semantic_cache import SemanticCache
+
+_VECTORS = {
+    "login": [1.0, 0.0, 0.0],
+    "login again": [1.0, 0.0, 0.0],
+    "near login": [0.6, 0.8, 0.0],  # cosine 0.6 against "login"
+    "billing": [0.0, 1.0, 0.0],
+    "export": [0.0, 0.0, 1.0],
+    "wide": [1.0, 0.0, 0.0, 0.0],
+}
+
+
+def _paths():
+    if semantic_cache._hnswlib is not None:
+        yield "hnswlib", nullcontext()
+    yield "numpy", mock.patch.object(semantic_cache, "_hnswlib", None)
+
+
+def _cache(threshold: float = 0.92, max_entries: int = 100) -> SemanticCache:
+    return SemanticCache(_VECTORS.__getitem__, threshold=threshold, max_entries=max_entries)
+
+
+class SemanticCacheTests(unittest.TestCase):
+    def _store(self, cache: SemanticCache, text: str, result: str) -> None:
+        unit, cached = cache.lookup(text)
+        self.assertIsNone(cached)
+        cache.store(unit, result)
+
+    def test_hit_at_or_above_threshold(self):
+        for name, patch in _paths():
+            with self.subTest(path=name), patch:
+                cache = _cache(threshold=0.6)
+                self._store(cache, "login", "account_access")
+                self.assertEqual(cache.lookup("login again")[1], "account_access")
+                self.assertEqual(cache.lookup("near login")[1], "account_access")
+
+    def test_miss_below_threshold(self):
+        for name, patch in _paths():
+            with self.subTest(path=name), patch:
+                cache = _cache(threshold=0.61)
+                self._store(cache, "login", "account_access")
+                self.assertIsNone(cache.lookup("near login")[1])
+                self.assertIsNone(cache.lookup("billing")[1])
+
+    def test_dimension_mismatch(self):
+        for name, patch in _paths():
+            with self.subTest(path=name), patch:
+                cache = _cache()
+                self._store(cache, "login", "account_access")
+                unit, cached = cache.lookup("wide")
+                self.assertIsNone(cached)
+                self.assertEqual(len(unit), 4)
+                cache.store(unit, "other")
+                self.assertEqual(len(cache), 1)
+                self.assertEqual(cache.lookup("login again")[1], "account_access")
+
+    def test_wraps_around_when_full(self):
+        for name, patch in _paths():
+            with self.subTest(path=name), patch:
+                cache = _cache(max_entries=2)
+                self._store(cache, "login", "account_access")
+                self._store(cache, "billing", "billing_payments")
+                self._store(cache, "export", "feature_request")  # overwrites "login"
+                self.assertEqual(len(cache), 2)
+                self.assertIsNone(cache.lookup("login again")[1])
+                self.assertEqual(cache.lookup("billing")[1], "billing_payments")
+                self.assertEqual(cache.lookup("export")[1], "feature_request")
+
+
+if __name__ == "__main__":
+    unittest.main()
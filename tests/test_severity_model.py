@@ -0,0 +1,30 @@
+"""Rule-based severity regressions: tiers must follow stdlib re semantics."""
+
+import unittest
+
+from ticketClassification.schema import Severity
+from ticketClassification.severity_model import _rule_based_severity
+
+
+class NonAsciiTierTests(unittest.TestCase):
+    # RE2's \s and \b are ASCII-only; these must keep the stdlib tiers.
+    CASES = [
+        ("all users affected", Severity.P1),  # em space is \s
+        ("how\xa0to reset my password", Severity.P4),  # non-breaking space
+        ("éoutage here", Severity.P3),  # é is \w: no boundary before "outage"
+        ("outageé", Severity.P3),  # ...nor after it
+    ]
+
+    def test_non_ascii_text(self):
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(_rule_based_severity(text).severity, expected)
+
+    def test_ascii_text(self):
+        self.assertEqual(_rule_based_severity("all users affected").severity, Severity.P1)
+        self.assertEqual(_rule_based_severity("major outage").severity, Severity.P1)
+        self.assertEqual(_rule_based_severity("how to export").severity, Severity.P4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+"""parse_datetime: only the ISO-8601 fast path is memoized."""
+
+import unittest
+from datetime import date, datetime, timezone
+from unittest import mock
+
+from ingestion.sources import base
+
+
+class ParseDatetimeTests(unittest.TestCase):
+    def test_iso_strings(self):
+        self.assertEqual(
+            base.parse_datetime("2024-03-01T10:00:00Z"),
+            datetime(2024, 3, 1, 10, tzinfo=timezone.utc),
+        )
+
+    def test_partial_dates_are_not_cached(self):
+        self.assertEqual(base.parse_datetime("10:30").date(), date.today())
+        with mock.patch.object(
+            base._dateutil_parser, "parse", return_value=datetime(2030, 1, 1, 10, 30)
+        ):
+            self.assertEqual(base.parse_datetime("10:30").year, 2030)
+
+
+if __name__ == "__main__":
+    unittest.main()
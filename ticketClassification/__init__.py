@@ -12,6 +12,7 @@ from ticketClassification.schema import (
     SeverityResult,
     TicketClassificationResult,
 )
+from ticketClassification.semantic_cache import SemanticCache
 from ticketClassification.service import ClassificationService
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "SeverityResult",
     "TicketClassificationResult",
     "ClassificationService",
+    "SemanticCache",
 ]
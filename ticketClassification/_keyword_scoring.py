@@ -0,0 +1,61 @@
+"""
+Inner loops of the rule-based category scorer.
+
+Fully annotated, dependency-free Python so mypyc can compile it to a C
+extension (python setup_mypyc.py build_ext --inplace). A compiled build next
+to this file is imported in its place; without one this file runs as-is.
+Scores are flat lists indexed by category position (see category_model).
+"""
+
+from typing import Iterable
+
+from common.text import is_word_char
+
+# (category index, keywords, single-word keywords)
+KeywordTable = list[tuple[int, tuple[str, ...], frozenset[str]]]
+# (end offset, (category index, keyword, keyword is a single word))
+AutomatonHits = Iterable[tuple[int, tuple[int, str, bool]]]
+
+
+def table_scores(
+    lower: str, words: set[str], table: KeywordTable, n_categories: int
+) -> list[float]:
+    """+1.0 per keyword occurring in lower, +0.5 per single-word keyword in words."""
+    scores: list[float] = [0.0] * n_categories
+    for i, keywords, single_words in table:
+        score: float = 0.0
+        for kw in keywords:
+            if kw in lower:
+                score += 1.0
+        # single-word match: one set intersection per category
+        scores[i] = score + 0.5 * len(single_words & words)
+    return scores
+
+
+def automaton_scores(lower: str, hits: AutomatonHits, n_categories: int) -> list[float]:
+    """Same scores from one Aho-Corasick pass; each keyword scores once however often it occurs."""
+    scores: list[float] = [0.0] * n_categories
+    found: set[str] = set()
+    whole: set[str] = set()
+    n: int = len(lower)
+    for end, (i, kw, single_word) in hits:
+        if kw not in found:
+            found.add(kw)
+            scores[i] += 1.0
+        if single_word and kw not in whole:
+            start: int = end - len(kw) + 1
+            if (start == 0 or not is_word_char(lower[start - 1])) and (
+                end + 1 == n or not is_word_char(lower[end + 1])
+            ):
+                whole.add(kw)
+                scores[i] += 0.5
+    return scores
+
+
+def best_index(scores: list[float]) -> int:
+    """Index of the highest score; the earliest wins ties, like max()."""
+    best: int = 0
+    for i in range(1, len(scores)):
+        if scores[i] > scores[best]:
+            best = i
+    return best
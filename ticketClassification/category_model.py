@@ -4,11 +4,27 @@ Category model: LLM or rule-based classifier using README taxonomy.
 Returns CategoryResult (category + confidence). Low confidence → human review.
 """
 
-import json
+import asyncio
 import re
-from typing import Callable
+from bisect import bisect_right
+from typing import Awaitable, Callable, Sequence
 
+import numpy as np
+import orjson
+
+from common.text import TicketView, is_word_char, strip_fence
+from ticketClassification._keyword_scoring import (
+    automaton_scores,
+    best_index,
+    table_scores,
+)
 from ticketClassification.schema import Category, CategoryResult
+from ticketClassification.semantic_cache import SemanticCache
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:  # optional single-pass keyword scan; per-keyword `in` fallback below
+    _ahocorasick = None
 
 
 # Rule-based keyword mapping (category -> list of lowercase keywords/phrases)
@@ -47,64 +63,220 @@ CATEGORY_KEYWORDS: dict[Category, list[str]] = {
 }
 
 
-def _rule_based_classify(text: str) -> CategoryResult:
-    """Classify using keyword matches; confidence from match strength."""
-    if not text or not text.strip():
-        return CategoryResult(category=Category.OTHER, confidence=0.0)
+_WORD_RE = re.compile(r"\w+")
+# ASCII non-word characters -> space, so translate + split tokenizes ASCII
+# text exactly like _WORD_RE without running the regex engine.
+_ASCII_NONWORD_TBL = str.maketrans(
+    {chr(i): " " for i in range(128) if not (chr(i).isalnum() or chr(i) == "_")}
+)
+
 
-    lower = text.lower()
-    words = set(re.findall(r"\w+", lower))
-    scores: dict[Category, float] = {}
+# Categories in CATEGORY_KEYWORDS order; scores are flat lists indexed the same
+# way, so ties resolve to the earlier category as before.
+_CAT_BY_INDEX: tuple[Category, ...] = tuple(CATEGORY_KEYWORDS)
+_CAT_INDEX: dict[Category, int] = {cat: i for i, cat in enumerate(_CAT_BY_INDEX)}
 
+
+def _build_automaton():
+    automaton = _ahocorasick.Automaton()
     for cat, keywords in CATEGORY_KEYWORDS.items():
-        score = 0.0
         for kw in keywords:
-            if kw in lower:
-                score += 1.0
-            # single-word match
-            if " " not in kw and kw in words:
-                score += 0.5
-        if score > 0:
-            scores[cat] = score
-
-    if not scores:
-        return CategoryResult(category=Category.OTHER, confidence=0.3)
-
-    best = max(scores, key=scores.get)
+            automaton.add_word(kw, (_CAT_INDEX[cat], kw, " " not in kw))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton() if _ahocorasick is not None else None
+
+# Fallback scan table, built once: (category index, keywords, single-word keywords)
+_KEYWORD_TABLE = [
+    (_CAT_INDEX[cat], tuple(keywords), frozenset(kw for kw in keywords if " " not in kw))
+    for cat, keywords in CATEGORY_KEYWORDS.items()
+]
+
+
+def _tokenize(lower: str) -> list[str]:
+    r"""\w+ tokens of lower; ASCII text skips the regex engine."""
+    if lower.isascii():
+        return lower.translate(_ASCII_NONWORD_TBL).split()
+    return _WORD_RE.findall(lower)
+
+
+def _keyword_scores(lower: str) -> list[float]:
+    """
+    Per-category score, indexed like _CAT_BY_INDEX: +1.0 for each keyword
+    occurring in the text, +0.5 more for a single-word keyword that occurs as
+    a whole word. The loops live in _keyword_scoring (mypyc-compiled when built).
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return table_scores(lower, set(_tokenize(lower)), _KEYWORD_TABLE, len(_CAT_BY_INDEX))
+    return automaton_scores(lower, _KEYWORD_AUTOMATON.iter(lower), len(_CAT_BY_INDEX))
+
+
+def _rule_based_classify(text: str, lower: str | None = None) -> CategoryResult:
+    """
+    Classify using keyword matches; confidence from match strength.
+
+    Results are built with model_construct: the values are internal and already
+    in range, so pydantic validation is skipped.
+    """
+    if not text or not text.strip():
+        return CategoryResult.model_construct(category=Category.OTHER, confidence=0.0)
+
+    scores = _keyword_scores(lower if lower is not None else text.lower())
+    best = best_index(scores)
+    if scores[best] <= 0:
+        return CategoryResult.model_construct(category=Category.OTHER, confidence=0.3)
+
     raw_conf = min(0.5 + scores[best] * 0.15, 0.95)
-    return CategoryResult(category=best, confidence=round(raw_conf, 2))
+    return CategoryResult.model_construct(
+        category=_CAT_BY_INDEX[best], confidence=round(raw_conf, 2)
+    )
+
+
+# Batch scoring: one column per keyword (CATEGORY_KEYWORDS order) and (K, C)
+# weight matrices, so per-ticket hits reduce to two matmuls.
+_BATCH_KEYWORDS: tuple[str, ...] = tuple(
+    kw for keywords in CATEGORY_KEYWORDS.values() for kw in keywords
+)
+_BATCH_WORDS: tuple[str, ...] = tuple(kw for kw in _BATCH_KEYWORDS if " " not in kw)
+
+
+def _batch_weights() -> tuple[np.ndarray, np.ndarray]:
+    keyword_weights = np.zeros((len(_BATCH_KEYWORDS), len(_CAT_BY_INDEX)))
+    word_weights = np.zeros((len(_BATCH_WORDS), len(_CAT_BY_INDEX)))
+    for cat, keywords in CATEGORY_KEYWORDS.items():
+        col = _CAT_INDEX[cat]
+        for kw in keywords:
+            keyword_weights[_BATCH_KEYWORDS.index(kw), col] = 1.0
+            if " " not in kw:
+                word_weights[_BATCH_WORDS.index(kw), col] = 0.5
+    return keyword_weights, word_weights
+
+
+_BATCH_KEYWORD_WEIGHTS, _BATCH_WORD_WEIGHTS = _batch_weights()
+
+
+def _item_starts(items: list[str]) -> list[int]:
+    """Offsets of each item in "\\0".join(items)."""
+    starts = [0] * len(items)
+    for i in range(1, len(items)):
+        starts[i] = starts[i - 1] + len(items[i - 1]) + 1
+    return starts
+
+
+def _batch_hits(
+    haystack: str, starts: list[int], needles: tuple[str, ...]
+) -> np.ndarray:
+    """
+    (N, len(needles)) 0/1 matrix: whether needle j occurs in item i of the
+    NUL-joined haystack. One str.find scan per needle; after a hit the scan
+    jumps to the next item, so each needle visits each item at most once.
+    """
+    n = len(starts)
+    hits = np.zeros((n, len(needles)))
+    for j, needle in enumerate(needles):
+        pos = haystack.find(needle)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            hits[i, j] = 1.0
+            if i + 1 == n:
+                break
+            pos = haystack.find(needle, starts[i + 1])
+    return hits
+
+
+_BATCH_KEYWORD_COL = {kw: j for j, kw in enumerate(_BATCH_KEYWORDS)}
+_BATCH_WORD_COL = {kw: j for j, kw in enumerate(_BATCH_WORDS)}
+
+
+def _batch_automaton_hits(lowers: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Keyword and whole-word hit matrices from one automaton pass over the batch."""
+    haystack = "\0".join(lowers)
+    starts = _item_starts(lowers)
+    n = len(lowers)
+    hits = np.zeros((n, len(_BATCH_KEYWORDS)))
+    word_hits = np.zeros((n, len(_BATCH_WORDS)))
+    size = len(haystack)
+    i = 0
+    for end, (_, kw, single_word) in _KEYWORD_AUTOMATON.iter(haystack):
+        # matches arrive in end order, so the item index only moves forward
+        while i + 1 < n and end >= starts[i + 1]:
+            i += 1
+        hits[i, _BATCH_KEYWORD_COL[kw]] = 1.0
+        if single_word:
+            # NUL separators are non-word characters, so item edges are boundaries
+            start = end - len(kw) + 1
+            if (start == 0 or not is_word_char(haystack[start - 1])) and (
+                end + 1 == size or not is_word_char(haystack[end + 1])
+            ):
+                word_hits[i, _BATCH_WORD_COL[kw]] = 1.0
+    return hits, word_hits
+
+
+def _rule_based_classify_batch(views: Sequence[TicketView]) -> list[CategoryResult]:
+    """
+    _rule_based_classify over a batch, with identical results. Tickets are
+    NUL-joined (no keyword contains NUL, so no match spans two tickets) and
+    scanned once: by the automaton when installed, else one str.find pass per
+    keyword plus " kw " lookups in the space-joined token streams for whole
+    words. The (N, K) hit matrices are scored with two matmuls.
+    """
+    if not views:
+        return []
+    lowers = [v.lower for v in views]
+    if _KEYWORD_AUTOMATON is not None:
+        hits, word_hits = _batch_automaton_hits(lowers)
+    else:
+        padded = [f" {' '.join(_tokenize(lower))} " for lower in lowers]
+        hits = _batch_hits("\0".join(lowers), _item_starts(lowers), _BATCH_KEYWORDS)
+        word_hits = _batch_hits(
+            "\0".join(padded), _item_starts(padded), tuple(f" {kw} " for kw in _BATCH_WORDS)
+        )
+    scores = hits @ _BATCH_KEYWORD_WEIGHTS + word_hits @ _BATCH_WORD_WEIGHTS
+    # argmax takes the first maximum, matching max() over CATEGORY_KEYWORDS order
+    best = scores.argmax(axis=1)
+    best_scores = scores[np.arange(len(views)), best].tolist()
+
+    results: list[CategoryResult] = []
+    for view, idx, score in zip(views, best.tolist(), best_scores):
+        if not view.text:
+            category, confidence = Category.OTHER, 0.0
+        elif score <= 0:
+            category, confidence = Category.OTHER, 0.3
+        else:
+            category = _CAT_BY_INDEX[idx]
+            confidence = round(min(0.5 + score * 0.15, 0.95), 2)
+        results.append(CategoryResult.model_construct(category=category, confidence=confidence))
+    return results
+
+
+# LLM category label (lowercased, spaces -> "_") -> Category; canonical values
+# plus common variants. Anything else maps to Category.OTHER.
+_CATEGORY_BY_LABEL: dict[str, Category] = {
+    **{c.value: c for c in Category},
+    "billing": Category.BILLING_PAYMENTS,
+    "payments": Category.BILLING_PAYMENTS,
+    "bug": Category.TECHNICAL_BUG,
+    "integration": Category.INTEGRATION_ISSUE,
+    "security": Category.SECURITY_ABUSE,
+    "abuse": Category.SECURITY_ABUSE,
+}
 
 
 def _parse_category_json(raw: str) -> CategoryResult | None:
     """Parse LLM JSON response into CategoryResult."""
-    raw = raw.strip()
-    # Strip markdown code block if present
-    if raw.startswith("```"):
-        raw = re.sub(r"^```\w*\n?", "", raw)
-        raw = re.sub(r"\n?```\s*$", "", raw)
+    raw = strip_fence(raw.strip())
     try:
-        data = json.loads(raw)
+        data = orjson.loads(raw)
+        if not isinstance(data, dict):
+            return None
         cat_str = (data.get("category") or "").strip().lower().replace(" ", "_")
-        # Map common variants to enum
-        if cat_str in ("billing", "payments"):
-            cat_str = "billing_payments"
-        elif cat_str in ("account_access", "account access"):
-            cat_str = "account_access"
-        elif cat_str in ("technical_bug", "technical bug", "bug"):
-            cat_str = "technical_bug"
-        elif cat_str in ("feature_request", "feature request"):
-            cat_str = "feature_request"
-        elif cat_str in ("integration_issue", "integration"):
-            cat_str = "integration_issue"
-        elif cat_str in ("security_abuse", "security", "abuse"):
-            cat_str = "security_abuse"
-        elif cat_str in ("general_inquiry", "general inquiry"):
-            cat_str = "general_inquiry"
-        category = Category(cat_str) if cat_str in [c.value for c in Category] else Category.OTHER
+        category = _CATEGORY_BY_LABEL.get(cat_str, Category.OTHER)
         confidence = float(data.get("confidence", 0.8))
         confidence = max(0.0, min(1.0, confidence))
         return CategoryResult(category=category, confidence=confidence)
-    except (json.JSONDecodeError, ValueError, KeyError):
+    except (ValueError, KeyError):  # orjson.JSONDecodeError is a ValueError
         return None
 
 
@@ -114,28 +286,103 @@ class CategoryModel:
 
     If llm_fn is provided, it is called with the prompt and should return
     the model's text response. If None or LLM fails, rule-based is used.
+    allm_fn is the async counterpart used by aclassify().
+    semantic_cache: optional SemanticCache consulted before each LLM call.
+    rule_confidence: rule-based results at or above this confidence are
+    returned without calling the LLM (default confidence_threshold + 0.1;
+    above 1.0 always calls it).
     """
 
     def __init__(
         self,
         llm_fn: Callable[[str], str] | None = None,
         confidence_threshold: float = 0.8,
+        allm_fn: Callable[[str], Awaitable[str]] | None = None,
+        semantic_cache: SemanticCache | None = None,
+        rule_confidence: float | None = None,
     ):
         self._llm = llm_fn
+        self._allm = allm_fn
+        self._semantic_cache = semantic_cache
+        self._prompt = ""
+        if llm_fn or allm_fn:
+            from ticketClassification.prompts import CATEGORY_PROMPT
+
+            self._prompt = CATEGORY_PROMPT
         self.confidence_threshold = confidence_threshold
+        self.rule_confidence = (
+            confidence_threshold + 0.1 if rule_confidence is None else rule_confidence
+        )
 
-    def classify(self, ticket_text: str) -> CategoryResult:
+    def classify(self, ticket_text: str | TicketView) -> CategoryResult:
         """Classify ticket text; use LLM if available else rule-based."""
-        text = (ticket_text or "").strip()
-        if self._llm:
-            from ticketClassification.prompts import CATEGORY_PROMPT
+        return self._classify(ticket_text)[0]
 
-            prompt = CATEGORY_PROMPT.format(ticket_text=text[:4000])
+    def _classify(self, ticket_text: str | TicketView) -> tuple[CategoryResult, bool]:
+        # Second item is True when the LLM failed and the rule-based result stands in
+        view = ticket_text if isinstance(ticket_text, TicketView) else TicketView.of(ticket_text)
+        text = view.text
+        rule = _rule_based_classify(text, view.lower)
+        if self._llm and not self._rule_is_confident(rule):
+            unit, cached = self._semantic_lookup(text)
+            if cached is not None:
+                return cached, False
+            prompt = self._prompt.format(ticket_text=text[:4000])
             try:
                 response = self._llm(prompt)
                 result = _parse_category_json(response)
                 if result is not None:
-                    return result
+                    self._semantic_store(unit, result)
+                    return result, False
+            except Exception:
+                pass
+            return rule, True
+        return rule, False
+
+    def classify_batch(self, views: Sequence[TicketView]) -> list[CategoryResult]:
+        """Classify prepared tickets; rule-based scoring is vectorized over the batch."""
+        if self._llm:
+            return [self.classify(view) for view in views]
+        return _rule_based_classify_batch(views)
+
+    async def aclassify(self, ticket_text: str | TicketView) -> CategoryResult:
+        """
+        Async classify: awaits allm_fn when set; a blocking llm_fn runs in a
+        worker thread so concurrent calls overlap. Rule-based runs inline.
+        """
+        return (await self._aclassify(ticket_text))[0]
+
+    async def _aclassify(self, ticket_text: str | TicketView) -> tuple[CategoryResult, bool]:
+        view = ticket_text if isinstance(ticket_text, TicketView) else TicketView.of(ticket_text)
+        rule = _rule_based_classify(view.text, view.lower)
+        if self._rule_is_confident(rule):
+            return rule, False
+        if self._allm:
+            unit, cached = self._semantic_lookup(view.text)
+            if cached is not None:
+                return cached, False
+            prompt = self._prompt.format(ticket_text=view.text[:4000])
+            try:
+                result = _parse_category_json(await self._allm(prompt))
+                if result is not None:
+                    self._semantic_store(unit, result)
+                    return result, False
             except Exception:
                 pass
-        return _rule_based_classify(text)
+            return rule, True
+        if self._llm:
+            return await asyncio.to_thread(self._classify, view)
+        return rule, False
+
+    def _rule_is_confident(self, rule: CategoryResult) -> bool:
+        return rule.confidence >= self.rule_confidence
+
+    def _semantic_lookup(self, text: str) -> tuple[object, CategoryResult | None]:
+        if self._semantic_cache is None:
+            return None, None
+        unit, cached = self._semantic_cache.lookup(text)
+        return unit, cached.model_copy() if cached is not None else None
+
+    def _semantic_store(self, unit: object, result: CategoryResult) -> None:
+        if self._semantic_cache is not None:
+            self._semantic_cache.store(unit, result.model_copy())
@@ -1,5 +1,8 @@
 """
 Prompt templates for LLM-based category and severity (from README).
+
+The ticket text is the last thing in each template, so everything before it is
+an identical prefix on every call and can be served from provider prompt caches.
 """
 
 CATEGORY_PROMPT = """Classify the support ticket into exactly one category.
@@ -14,11 +17,11 @@ Categories:
 - general_inquiry: How-to, question, documentation, general support
 - other: Anything that does not fit above
 
-Ticket:
-{ticket_text}
-
 Return valid JSON only, no markdown:
-{{ "category": "<one of the category values above>", "confidence": <number between 0 and 1> }}"""
+{{ "category": "<one of the category values above>", "confidence": <number between 0 and 1> }}
+
+Ticket:
+{ticket_text}"""
 
 
 SEVERITY_PROMPT = """Assign a severity level to this support ticket.
@@ -31,8 +34,8 @@ Severity scale:
 
 Consider: system outage, payment failure, security breach, VIP/revenue impact, SLA risk.
 
-Ticket:
-{ticket_text}
-
 Return valid JSON only, no markdown:
-{{ "severity": "P1" or "P2" or "P3" or "P4", "reason": "<short reason>" }}"""
+{{ "severity": "P1" or "P2" or "P3" or "P4", "reason": "<short reason>" }}
+
+Ticket:
+{ticket_text}"""
@@ -0,0 +1,104 @@
+"""
+Semantic result cache for LLM-backed category/severity models.
+
+Near-duplicate tickets ("my login doesn't work", "can't log in") reuse a cached
+result when their embeddings reach the cosine threshold (0.92, as in the
+deduplication README). Nearest-neighbour lookup uses hnswlib when installed,
+otherwise one matmul over the stored unit vectors.
+"""
+
+from typing import Callable, Generic, TypeVar
+
+import numpy as np
+
+from common.vectors import l2_normalize
+
+try:
+    import hnswlib as _hnswlib
+except ImportError:
+    _hnswlib = None
+
+T = TypeVar("T")
+
+
+class SemanticCache(Generic[T]):
+    """
+    Embedding-keyed cache of model results.
+
+    embedding_fn: str -> list[float] (same contract as deduplication's).
+    threshold: minimum cosine similarity for a hit.
+    max_entries: capacity; once full, the oldest entry's slot is overwritten.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[str], list[float]],
+        threshold: float = 0.92,
+        max_entries: int = 10_000,
+    ):
+        self._embed = embedding_fn
+        self.threshold = threshold
+        self._max_entries = max_entries
+        self._results: list[T] = []
+        self._next = 0
+        self._dim: int | None = None
+        self._index = None
+        self._matrix: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def lookup(self, text: str) -> tuple[np.ndarray | None, T | None]:
+        """
+        Embed text and return (unit embedding, cached result or None).
+
+        Pass the embedding back to store() on a miss so the text is embedded once.
+        """
+        unit = l2_normalize(self._embed(text))
+        if unit is None or not self._results or len(unit) != self._dim:
+            return unit, None
+        if self._index is not None:
+            labels, distances = self._index.knn_query(unit, k=1)
+            slot = int(labels[0][0])
+            similarity = 1.0 - float(distances[0][0])
+        else:
+            sims = self._matrix[: len(self._results)] @ unit
+            slot = int(np.argmax(sims))
+            similarity = float(sims[slot])
+        if similarity >= self.threshold:
+            return unit, self._results[slot]
+        return unit, None
+
+    def store(self, unit: np.ndarray | None, result: T) -> None:
+        """Cache result under the embedding returned by lookup()."""
+        if unit is None or self._max_entries <= 0:
+            return
+        if self._dim is None:
+            self._dim = len(unit)
+            if _hnswlib is not None:
+                self._index = _hnswlib.Index(space="cosine", dim=self._dim)
+                self._index.init_index(max_elements=self._max_entries)
+            else:
+                self._matrix = np.empty(
+                    (min(self._max_entries, 256), self._dim), dtype=np.float32
+                )
+        elif len(unit) != self._dim:
+            return
+        slot = self._next % self._max_entries
+        self._next += 1
+        if self._index is not None:
+            # Re-adding an existing label replaces its vector in place
+            self._index.add_items(unit[None, :], [slot])
+        else:
+            if slot >= len(self._matrix):
+                grown = np.empty(
+                    (min(self._max_entries, 2 * len(self._matrix)), self._dim),
+                    dtype=np.float32,
+                )
+                grown[: len(self._matrix)] = self._matrix
+                self._matrix = grown
+            self._matrix[slot] = unit
+        if slot == len(self._results):
+            self._results.append(result)
+        else:
+            self._results[slot] = result
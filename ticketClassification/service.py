@@ -4,6 +4,12 @@ Classification service: run category + severity on a NormalizedTicket.
 Uses confidence threshold from README: below threshold → needs_human_review.
 """
 
+import asyncio
+import hashlib
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from common.text import TicketView
 from ticketClassification.schema import (
     CategoryResult,
     SeverityResult,
@@ -12,6 +18,8 @@ from ticketClassification.schema import (
 from ticketClassification.category_model import CategoryModel
 from ticketClassification.severity_model import SeverityModel
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
 
 class ClassificationService:
     """
@@ -19,6 +27,15 @@ class ClassificationService:
 
     Consumes NormalizedTicket (ingestion schema); returns TicketClassificationResult
     with category, severity, and needs_human_review when confidence < threshold.
+
+    cache_size: LRU entries of (category, severity) keyed by a blake2b digest of
+    the classified text, so duplicate tickets and retries skip both models
+    (0 disables). See cache_info().
+
+    When both models are LLM-backed, classify() runs them on two threads and
+    aclassify() awaits them concurrently, so latency is one LLM call, not two.
+    The worker threads are released by close(), or by using the service as a
+    context manager.
     """
 
     def __init__(
@@ -26,12 +43,18 @@ class ClassificationService:
         category_model: CategoryModel | None = None,
         severity_model: SeverityModel | None = None,
         confidence_threshold: float = 0.8,
+        cache_size: int = 4096,
     ):
         self._category = category_model or CategoryModel(
             confidence_threshold=confidence_threshold
         )
         self._severity = severity_model or SeverityModel()
         self.confidence_threshold = confidence_threshold
+        self._cache: OrderedDict[bytes, tuple[CategoryResult, SeverityResult]] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._pool: ThreadPoolExecutor | None = None
 
     def classify(self, ticket: "NormalizedTicket") -> TicketClassificationResult:
         """
@@ -39,23 +62,137 @@ class ClassificationService:
 
         ticket: from ingestion (has ticket_id, cleaned_text, subject, etc.).
         """
+        text = self._ticket_text(ticket)
+        key, cached = self._cache_lookup(text)
+        if cached is None:
+            view = TicketView.of(text)
+            if self._category._llm and self._severity._llm:
+                # Both models block on network calls; run them side by side
+                category_future = self._executor().submit(self._category._classify, view)
+                severity = self._severity._classify(view)
+                category = category_future.result()
+            else:
+                category = self._category._classify(view)
+                severity = self._severity._classify(view)
+            cached = self._cache_store(key, category, severity)
+        return self._result(ticket, cached)
+
+    async def aclassify(self, ticket: "NormalizedTicket") -> TicketClassificationResult:
+        """Async classify: category and severity are awaited concurrently."""
+        text = self._ticket_text(ticket)
+        key, cached = self._cache_lookup(text)
+        if cached is None:
+            view = TicketView.of(text)
+            category, severity = await asyncio.gather(
+                self._category._aclassify(view), self._severity._aclassify(view)
+            )
+            cached = self._cache_store(key, category, severity)
+        return self._result(ticket, cached)
+
+    def classify_batch(
+        self, tickets: list["NormalizedTicket"]
+    ) -> list[TicketClassificationResult]:
+        """
+        Classify many tickets. With rule-based models the category scoring is
+        vectorized across the batch; LLM-backed models go through classify().
+        """
+        if self._category._llm or self._severity._llm:
+            return [self.classify(ticket) for ticket in tickets]
+        views = [TicketView.of(self._ticket_text(ticket)) for ticket in tickets]
+        categories = self._category.classify_batch(views)
+        severities = self._severity.classify_batch(views)
+        return [
+            TicketClassificationResult.model_construct(
+                ticket_id=ticket.ticket_id,
+                category=category_result,
+                severity=severity_result,
+                needs_human_review=category_result.confidence < self.confidence_threshold,
+            )
+            for ticket, category_result, severity_result in zip(
+                tickets, categories, severities
+            )
+        ]
+
+    @staticmethod
+    def _ticket_text(ticket: "NormalizedTicket") -> str:
         # Use cleaned_text for classification; optionally prepend subject
         text = ticket.cleaned_text or ""
         if ticket.subject:
             text = f"{ticket.subject}\n\n{text}".strip()
+        return text
+
+    def _result(
+        self,
+        ticket: "NormalizedTicket",
+        results: tuple[CategoryResult, SeverityResult],
+    ) -> TicketClassificationResult:
+        # Copies, so callers mutating one result cannot alter the cached entry
+        category_result, severity_result = results
+        return TicketClassificationResult.model_construct(
+            ticket_id=ticket.ticket_id,
+            category=category_result.model_copy(),
+            severity=severity_result.model_copy(),
+            needs_human_review=category_result.confidence < self.confidence_threshold,
+        )
 
-        category_result: CategoryResult = self._category.classify(text)
-        severity_result: SeverityResult = self._severity.classify(text)
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=2)
+        return self._pool
 
-        needs_review = category_result.confidence < self.confidence_threshold
+    def close(self) -> None:
+        """Shut down the worker threads used by classify(); a later call starts new ones."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
 
-        return TicketClassificationResult(
-            ticket_id=ticket.ticket_id,
-            category=category_result,
-            severity=severity_result,
-            needs_human_review=needs_review,
+    def __enter__(self) -> "ClassificationService":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _cache_lookup(
+        self, text: str
+    ) -> tuple[bytes | None, tuple[CategoryResult, SeverityResult] | None]:
+        if not self._cache_size:
+            return None, None
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is None:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+        return key, cached
+
+    def _cache_store(
+        self,
+        key: bytes | None,
+        category: tuple[CategoryResult, bool],
+        severity: tuple[SeverityResult, bool],
+    ) -> tuple[CategoryResult, SeverityResult]:
+        # Each model reports (result, fell_back); a rule-based stand-in for a
+        # failed LLM call is returned but not cached, so a retry asks again
+        results = (category[0], severity[0])
+        if key is None or category[1] or severity[1]:
+            return results
+        self._cache[key] = results
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return results
+
+    def cache_info(self) -> CacheInfo:
+        """Result-cache statistics, like functools.lru_cache's cache_info()."""
+        return CacheInfo(
+            self._cache_hits, self._cache_misses, self._cache_size, len(self._cache)
         )
 
+    def cache_clear(self) -> None:
+        """Drop cached results and reset statistics."""
+        self._cache.clear()
+        self._cache_hits = self._cache_misses = 0
+
 
 # Type hint for NormalizedTicket (avoid circular import if ingestion not installed)
 try:
@@ -5,11 +5,25 @@ Signals: system outage, payment failure, security breach, VIP, revenue impact, S
 Output: P1–P4 with reason.
 """
 
-import json
+import asyncio
 import re
-from typing import Callable
+from typing import Awaitable, Callable, Sequence
 
+import orjson
+
+from common.text import TicketView, is_word_char, strip_fence
 from ticketClassification.schema import Severity, SeverityResult
+from ticketClassification.semantic_cache import SemanticCache
+
+try:
+    import re2 as _re2  # google-re2: linear-time DFA matching
+except ImportError:
+    _re2 = None
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:  # literal tiers then go through the regex cascade
+    _ahocorasick = None
 
 
 # P1 signals (outage / critical)
@@ -42,55 +56,191 @@ P4_PATTERNS = [
     r"\b(would\s+be\s+nice|suggestion)\b",
 ]
 
+# One alternation per tier, compiled once; patterns are lowercase and run over
+# lowercased text, so no re.I. Tiers stay separate:
+# in a single alternation a lower-tier match can consume a higher-tier one
+# ("major outage" is P2 text containing the P1 signal "outage").
+_TIERS = (
+    (P1_PATTERNS, Severity.P1, "Detected critical/outage or system-down language"),
+    (P2_PATTERNS, Severity.P2, "Detected major degradation or high-impact signal"),
+    (P4_PATTERNS, Severity.P4, "Detected low-priority or request-type language"),
+)
+_TIER_RES = tuple(
+    (re.compile("|".join(f"(?:{p})" for p in patterns)), severity, reason)
+    for patterns, severity, reason in _TIERS
+)
+
+# With RE2, one Set scan reports every tier that matches anywhere in the text;
+# the highest-priority tier is the lowest set bit of that mask. RE2's \b and \s
+# are ASCII-only, so the Set is used for ASCII text only; anything else goes
+# through the stdlib-semantics paths below.
+_TIER_SET = None
+if _re2 is not None:
+    _TIER_SET = _re2.Set.SearchSet()
+    for patterns, _, _ in _TIERS:
+        _TIER_SET.Add("|".join(f"(?:{p})" for p in patterns))
+    _TIER_SET.Compile()
+
+# Text the RE2 Set cannot take (no RE2, or non-ASCII): patterns built only from
+# literals, (a|b) groups, optional groups and \s+ between \b anchors are
+# expanded into plain strings and found with one Aho-Corasick pass, checking \b
+# (Unicode \w, as in re) at each hit. Literals containing \s+ are matched
+# against the text with whitespace runs collapsed to one space; those with a
+# literal space against the raw text. Anything else stays a stdlib regex.
+_WS = "\t"  # stands for \s+ in an expanded literal
+
+
+def _expand_seq(s: str, i: int) -> tuple[list[str] | None, int]:
+    alternatives: list[str] = []
+    current = [""]
+    while i < len(s) and s[i] != ")":
+        ch = s[i]
+        if ch == "|":
+            alternatives += current
+            current = [""]
+            i += 1
+        elif ch == "(":
+            inner, i = _expand_seq(s, i + 1)
+            if inner is None or i >= len(s):
+                return None, i
+            i += 1
+            if s.startswith("?", i):
+                inner = ["", *inner]
+                i += 1
+            current = [c + v for c in current for v in inner]
+        elif s.startswith(r"\s+", i):
+            current = [c + _WS for c in current]
+            i += 3
+        elif ch.isalnum() or ch == " ":
+            current = [c + ch for c in current]
+            i += 1
+        else:
+            return None, i
+    return alternatives + current, i
+
+
+def _expand_literals(pattern: str) -> list[str] | None:
+    """Every string a literal \\b...\\b pattern matches (\\s+ as _WS), else None."""
+    if not (pattern.startswith(r"\b") and pattern.endswith(r"\b")):
+        return None
+    body = pattern[2:-2]
+    literals, i = _expand_seq(body, 0)
+    if literals is None or i != len(body):
+        return None
+    for lit in literals:
+        if not lit or not (is_word_char(lit[0]) and is_word_char(lit[-1])):
+            return None
+        if _WS in lit and " " in lit:
+            return None  # mixed exact/run whitespace fits neither text form
+    return literals
+
+
+def _build_tier_automaton():
+    # value: (literal, tiers when scanning raw text, tiers when scanning collapsed)
+    entries: dict[str, tuple[set[int], set[int]]] = {}
+    residual: list[re.Pattern | None] = []
+    for tier, (patterns, _, _) in enumerate(_TIERS):
+        rest = []
+        for pattern in patterns:
+            literals = _expand_literals(pattern)
+            if literals is None:
+                rest.append(pattern)
+                continue
+            for lit in literals:
+                raw_tiers, collapsed_tiers = entries.setdefault(
+                    lit.replace(_WS, " "), (set(), set())
+                )
+                if _WS not in lit:
+                    raw_tiers.add(tier)
+                if " " not in lit:
+                    collapsed_tiers.add(tier)
+        residual.append(re.compile("|".join(f"(?:{p})" for p in rest)) if rest else None)
+    automaton = _ahocorasick.Automaton()
+    for lit, (raw_tiers, collapsed_tiers) in entries.items():
+        automaton.add_word(lit, (lit, frozenset(raw_tiers), frozenset(collapsed_tiers)))
+    automaton.make_automaton()
+    return automaton, tuple(residual)
+
+
+_TIER_AUTOMATON = None
+_TIER_RESIDUAL_RES: tuple[re.Pattern | None, ...] = ()
+if _ahocorasick is not None:
+    _TIER_AUTOMATON, _TIER_RESIDUAL_RES = _build_tier_automaton()
+
+
+def _scan_tiers(text: str, slot: int | None) -> set[int]:
+    """Tiers with a whole-word literal hit; slot 1 = raw, 2 = collapsed, None = both."""
+    hit: set[int] = set()
+    n = len(text)
+    for end, entry in _TIER_AUTOMATON.iter(text):
+        lit = entry[0]
+        start = end - len(lit) + 1
+        if (start == 0 or not is_word_char(text[start - 1])) and (
+            end + 1 == n or not is_word_char(text[end + 1])
+        ):
+            hit |= entry[1] | entry[2] if slot is None else entry[slot]
+    return hit
+
+
+def _literal_tiers(lower: str) -> set[int]:
+    collapsed = " ".join(lower.split())
+    if collapsed == lower:
+        return _scan_tiers(lower, None)
+    return _scan_tiers(lower, 1) | _scan_tiers(collapsed, 2)
+
+
+def _rule_based_severity(text: str, lower: str | None = None) -> SeverityResult:
+    """
+    Assign severity from keyword/signal rules; default P3.
 
-def _rule_based_severity(text: str) -> SeverityResult:
-    """Assign severity from keyword/signal rules; default P3."""
+    Built with model_construct (internal values), skipping pydantic validation.
+    """
     if not text or not text.strip():
-        return SeverityResult(severity=Severity.P4, reason="Empty ticket")
-
-    lower = text.lower()
-
-    for pattern in P1_PATTERNS:
-        if re.search(pattern, lower, re.I):
-            return SeverityResult(
-                severity=Severity.P1,
-                reason="Detected critical/outage or system-down language",
-            )
-
-    for pattern in P2_PATTERNS:
-        if re.search(pattern, lower, re.I):
-            return SeverityResult(
-                severity=Severity.P2,
-                reason="Detected major degradation or high-impact signal",
-            )
-
-    for pattern in P4_PATTERNS:
-        if re.search(pattern, lower, re.I):
-            return SeverityResult(
-                severity=Severity.P4,
-                reason="Detected low-priority or request-type language",
-            )
-
-    return SeverityResult(
+        return SeverityResult.model_construct(severity=Severity.P4, reason="Empty ticket")
+
+    if lower is None:
+        lower = text.lower()
+
+    if _TIER_SET is not None and lower.isascii():
+        mask = 0
+        for tier in _TIER_SET.Match(lower) or ():
+            mask |= 1 << tier
+        if mask:
+            _, severity, reason = _TIERS[(mask & -mask).bit_length() - 1]
+            return SeverityResult.model_construct(severity=severity, reason=reason)
+    elif _TIER_AUTOMATON is not None:
+        hit = _literal_tiers(lower)
+        for tier, (_, severity, reason) in enumerate(_TIERS):
+            residual = _TIER_RESIDUAL_RES[tier]
+            if tier in hit or (residual is not None and residual.search(lower)):
+                return SeverityResult.model_construct(severity=severity, reason=reason)
+    else:
+        for pattern, severity, reason in _TIER_RES:
+            if pattern.search(lower):
+                return SeverityResult.model_construct(severity=severity, reason=reason)
+
+    return SeverityResult.model_construct(
         severity=Severity.P3,
         reason="Standard issue; no P1/P2/P4 signals detected",
     )
 
 
+# LLM severity label ("P1".."P4") -> Severity; anything else maps to P3.
+_SEVERITY_BY_VALUE: dict[str, Severity] = {s.value: s for s in Severity}
+
+
 def _parse_severity_json(raw: str) -> SeverityResult | None:
     """Parse LLM JSON into SeverityResult."""
-    raw = raw.strip()
-    if raw.startswith("```"):
-        raw = re.sub(r"^```\w*\n?", "", raw)
-        raw = re.sub(r"\n?```\s*$", "", raw)
+    raw = strip_fence(raw.strip())
     try:
-        data = json.loads(raw)
+        data = orjson.loads(raw)
+        if not isinstance(data, dict):
+            return None
         sev = (data.get("severity") or "P3").strip().upper()
-        if sev not in ("P1", "P2", "P3", "P4"):
-            sev = "P3"
+        severity = _SEVERITY_BY_VALUE.get(sev, Severity.P3)
         reason = (data.get("reason") or "").strip() or "LLM-assigned"
-        return SeverityResult(severity=Severity(sev), reason=reason)
-    except (json.JSONDecodeError, ValueError, KeyError):
+        return SeverityResult(severity=severity, reason=reason)
+    except (ValueError, KeyError):  # orjson.JSONDecodeError is a ValueError
         return None
 
 
@@ -99,24 +249,99 @@ class SeverityModel:
     Severity detector: optional LLM with rule-based fallback.
 
     Rule-based uses README signals (outage, payment failure, security, etc.)
-    to assign P1–P4. LLM can override with a reason.
+    to assign P1–P4. LLM can override with a reason. allm_fn is the async
+    counterpart used by aclassify().
+    semantic_cache: optional SemanticCache consulted before each LLM call.
+    rule_trusted: rule-based severities returned without calling the LLM
+    (default P1/P4 signal hits; the LLM decides the P2/P3 boundary).
     """
 
-    def __init__(self, llm_fn: Callable[[str], str] | None = None):
+    def __init__(
+        self,
+        llm_fn: Callable[[str], str] | None = None,
+        allm_fn: Callable[[str], Awaitable[str]] | None = None,
+        semantic_cache: SemanticCache | None = None,
+        rule_trusted: frozenset[Severity] = frozenset({Severity.P1, Severity.P4}),
+    ):
         self._llm = llm_fn
+        self._allm = allm_fn
+        self._semantic_cache = semantic_cache
+        self._prompt = ""
+        if llm_fn or allm_fn:
+            from ticketClassification.prompts import SEVERITY_PROMPT
+
+            self._prompt = SEVERITY_PROMPT
+        self.rule_trusted = rule_trusted
 
-    def classify(self, ticket_text: str) -> SeverityResult:
+    def classify(self, ticket_text: str | TicketView) -> SeverityResult:
         """Assign severity (P1–P4) and reason."""
-        text = (ticket_text or "").strip()
-        if self._llm:
-            from ticketClassification.prompts import SEVERITY_PROMPT
+        return self._classify(ticket_text)[0]
 
-            prompt = SEVERITY_PROMPT.format(ticket_text=text[:4000])
+    def _classify(self, ticket_text: str | TicketView) -> tuple[SeverityResult, bool]:
+        # Second item is True when the LLM failed and the rule-based result stands in
+        view = ticket_text if isinstance(ticket_text, TicketView) else TicketView.of(ticket_text)
+        text = view.text
+        rule = _rule_based_severity(text, view.lower)
+        if self._llm and not self._rule_is_confident(rule):
+            unit, cached = self._semantic_lookup(text)
+            if cached is not None:
+                return cached, False
+            prompt = self._prompt.format(ticket_text=text[:4000])
             try:
                 response = self._llm(prompt)
                 result = _parse_severity_json(response)
                 if result is not None:
-                    return result
+                    self._semantic_store(unit, result)
+                    return result, False
+            except Exception:
+                pass
+            return rule, True
+        return rule, False
+
+    def classify_batch(self, views: Sequence[TicketView]) -> list[SeverityResult]:
+        """Assign severity (P1–P4) to prepared tickets."""
+        if self._llm:
+            return [self.classify(view) for view in views]
+        return [_rule_based_severity(view.text, view.lower) for view in views]
+
+    async def aclassify(self, ticket_text: str | TicketView) -> SeverityResult:
+        """
+        Async classify: awaits allm_fn when set; a blocking llm_fn runs in a
+        worker thread so concurrent calls overlap. Rule-based runs inline.
+        """
+        return (await self._aclassify(ticket_text))[0]
+
+    async def _aclassify(self, ticket_text: str | TicketView) -> tuple[SeverityResult, bool]:
+        view = ticket_text if isinstance(ticket_text, TicketView) else TicketView.of(ticket_text)
+        rule = _rule_based_severity(view.text, view.lower)
+        if self._rule_is_confident(rule):
+            return rule, False
+        if self._allm:
+            unit, cached = self._semantic_lookup(view.text)
+            if cached is not None:
+                return cached, False
+            prompt = self._prompt.format(ticket_text=view.text[:4000])
+            try:
+                result = _parse_severity_json(await self._allm(prompt))
+                if result is not None:
+                    self._semantic_store(unit, result)
+                    return result, False
             except Exception:
                 pass
-        return _rule_based_severity(text)
+            return rule, True
+        if self._llm:
+            return await asyncio.to_thread(self._classify, view)
+        return rule, False
+
+    def _rule_is_confident(self, rule: SeverityResult) -> bool:
+        return rule.severity in self.rule_trusted
+
+    def _semantic_lookup(self, text: str) -> tuple[object, SeverityResult | None]:
+        if self._semantic_cache is None:
+            return None, None
+        unit, cached = self._semantic_cache.lookup(text)
+        return unit, cached.model_copy() if cached is not None else None
+
+    def _semantic_store(self, unit: object, result: SeverityResult) -> None:
+        if self._semantic_cache is not None:
+            self._semantic_cache.store(unit, result.model_copy())